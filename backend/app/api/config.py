@@ -1,15 +1,19 @@
 """GET/PUT /api/config - Configuration management."""
 
+import asyncio
+import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..ipc.dependencies import get_ipc_client
 from ..models.database import get_db
 from ..models.station_config import StationConfigModel
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Default config items derived from application settings.
@@ -105,8 +109,20 @@ def get_config(db: Session = Depends(get_db)):
     return result
 
 
+async def _notify_uploader_config_change() -> None:
+    """Ask the logger daemon to drop its cached uploader config."""
+    try:
+        await get_ipc_client().send_command({"cmd": "reload_uploaders"})
+    except (ConnectionRefusedError, OSError, asyncio.TimeoutError, RuntimeError) as exc:
+        logger.debug("Uploader config reload not sent: %s", exc)
+
+
 @router.put("/config")
-def update_config(updates: list[ConfigUpdate], db: Session = Depends(get_db)):
+def update_config(
+    updates: list[ConfigUpdate],
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """Update one or more configuration values."""
     for update in updates:
         # Python's str(True) produces "True" — normalize bools to lowercase
@@ -124,5 +140,10 @@ def update_config(updates: list[ConfigUpdate], db: Session = Depends(get_db)):
             )
             db.add(new_item)
     db.commit()
+    if any(
+        update.key.startswith(("wu_", "cwop_")) or update.key in ("latitude", "longitude")
+        for update in updates
+    ):
+        background_tasks.add_task(_notify_uploader_config_change)
     items = db.query(StationConfigModel).all()
     return [{"key": item.key, "value": _coerce_value(item.value)} for item in items]
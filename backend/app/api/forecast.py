@@ -1,5 +1,6 @@
 """GET /api/forecast - Zambretti barometric + optional NWS forecast."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
@@ -16,53 +17,60 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/forecast")
-async def get_forecast(db: Session = Depends(get_db)):
-    """Return Zambretti local forecast and optional NWS grid forecast."""
-    now = datetime.now(timezone.utc)
-
-    # --- Zambretti (local barometric) ---
-    local_forecast = None
-
+def _local_forecast(db: Session, now: datetime) -> dict | None:
+    """Zambretti forecast from the latest barometer readings (blocking DB I/O)."""
     latest = (
         db.query(SensorReadingModel)
         .filter(SensorReadingModel.barometer.isnot(None))
         .order_by(SensorReadingModel.timestamp.desc())
         .first()
     )
+    if latest is None or latest.barometer is None:
+        return None
+
+    cutoff_3h = datetime.fromtimestamp(
+        now.timestamp() - 3 * 3600, tz=timezone.utc
+    )
+    oldest = (
+        db.query(SensorReadingModel)
+        .filter(SensorReadingModel.barometer.isnot(None))
+        .filter(SensorReadingModel.timestamp >= cutoff_3h)
+        .order_by(SensorReadingModel.timestamp)
+        .first()
+    )
 
-    if latest is not None and latest.barometer is not None:
-        cutoff_3h = datetime.fromtimestamp(
-            now.timestamp() - 3 * 3600, tz=timezone.utc
-        )
-        oldest = (
-            db.query(SensorReadingModel)
-            .filter(SensorReadingModel.barometer.isnot(None))
-            .filter(SensorReadingModel.timestamp >= cutoff_3h)
-            .order_by(SensorReadingModel.timestamp)
-            .first()
-        )
-
-        pressure_change = (
-            latest.barometer - oldest.barometer
-            if oldest is not None and oldest.barometer is not None
-            else 0
-        )
-
-        result = zambretti_forecast(
-            pressure_thousandths=latest.barometer,
-            pressure_change_3h=pressure_change,
-            wind_dir_deg=latest.wind_direction,
-            month=now.month,
-        )
-
-        local_forecast = {
-            "source": "zambretti",
-            "text": result.forecast_text,
-            "confidence": round(result.confidence * 100),
-            "trend": result.trend,
-            "updated": now.isoformat(),
-        }
+    pressure_change = (
+        latest.barometer - oldest.barometer
+        if oldest is not None and oldest.barometer is not None
+        else 0
+    )
+
+    result = zambretti_forecast(
+        pressure_thousandths=latest.barometer,
+        pressure_change_3h=pressure_change,
+        wind_dir_deg=latest.wind_direction,
+        month=now.month,
+    )
+
+    return {
+        "source": "zambretti",
+        "text": result.forecast_text,
+        "confidence": round(result.confidence * 100),
+        "trend": result.trend,
+        "updated": now.isoformat(),
+    }
+
+
+@router.get("/forecast")
+async def get_forecast(db: Session = Depends(get_db)):
+    """Return Zambretti local forecast and optional NWS grid forecast."""
+    now = datetime.now(timezone.utc)
+
+    # --- Zambretti (local barometric) ---
+    # The readings queries scan the largest table; keep them off the event
+    # loop that also drives the live WebSocket broadcast.
+    loop = asyncio.get_running_loop()
+    local_forecast = await loop.run_in_executor(None, _local_forecast, db, now)
 
     # --- NWS (grid forecast) ---
     nws_forecast = None
@@ -19,6 +19,7 @@ from ..services.spray_engine import (
     SprayEvaluation,
     evaluate_conditions,
     evaluate_current,
+    evaluate_many,
     fetch_hourly_forecast,
     find_optimal_window,
     get_tuned_constraints,
@@ -385,6 +386,82 @@ def reset_presets(db: Session = Depends(get_db)):
 # Schedules CRUD
 # ---------------------------------------------------------------------------
 
+def _reevaluate_schedules(
+    needs_eval: list[tuple[SpraySchedule, SprayProduct]],
+    obs: dict,
+    hourly: dict | None,
+    tz: str,
+) -> None:
+    """Refresh each schedule's evaluation and status in place.
+
+    Every schedule is evaluated against current observations; those with
+    a parseable window also get the forecast rain-free check when a
+    forecast is available.
+    """
+    constraints_by_id: dict[int, ProductConstraints] = {}
+    windows: dict[int, tuple[datetime, datetime]] = {}
+    for s, p in needs_eval:
+        try:
+            constraints_by_id[s.id] = _product_constraints(p)
+        except Exception as exc:
+            logger.warning("Re-evaluation failed for schedule #%d: %s", s.id, exc)
+            continue
+        if hourly:
+            try:
+                windows[s.id] = (
+                    _parse_schedule_datetime(s.planned_date, s.planned_start, tz),
+                    _parse_schedule_datetime(s.planned_date, s.planned_end, tz),
+                )
+            except Exception as exc:
+                # Still evaluated from observations below, just without forecast
+                logger.warning("Forecast window invalid for schedule #%d: %s", s.id, exc)
+
+    # Evaluate all schedules against the forecast in one batch so
+    # schedules sharing a window share the forecast reductions.
+    forecast_evs: dict[int, SprayEvaluation] = {}
+    if hourly and windows:
+        try:
+            results = evaluate_many(
+                [(constraints_by_id[sid], *window) for sid, window in windows.items()],
+                hourly,
+            )
+            forecast_evs = dict(zip(windows, results))
+        except Exception as exc:
+            # Fall back to evaluating schedules one at a time so one
+            # bad schedule cannot blank the forecast for the rest.
+            logger.warning("Batch schedule evaluation failed: %s", exc)
+            for sid, (start_dt, end_dt) in windows.items():
+                try:
+                    forecast_evs[sid] = evaluate_conditions(
+                        constraints_by_id[sid], hourly, start_dt, end_dt,
+                    )
+                except Exception as exc:
+                    logger.warning("Forecast evaluation failed for schedule #%d: %s", sid, exc)
+
+    for s, p in needs_eval:
+        constraints = constraints_by_id.get(s.id)
+        if constraints is None:
+            continue
+        try:
+            ev = _merged_evaluation(constraints, obs, forecast_evs.get(s.id))
+            s.evaluation = json.dumps(_evaluation_to_dict(ev))
+            rule_go = ev.go
+
+            # AI override: if AI commentary says no-go, it has broader
+            # data sources (HRRR, NWS, radar) and should take precedence.
+            ai_go = _ai_says_go(s.ai_commentary)
+            if rule_go and ai_go is False:
+                s.status = "no_go"
+                logger.info(
+                    "Schedule #%d: rule engine says GO but AI says NO-GO — using AI",
+                    s.id,
+                )
+            else:
+                s.status = "go" if rule_go else "no_go"
+        except Exception as exc:
+            logger.warning("Re-evaluation failed for schedule #%d: %s", s.id, exc)
+
+
 @router.get("/schedules")
 async def list_schedules(db: Session = Depends(get_db)):
     """List spray schedules with product names, newest first.
@@ -414,31 +491,7 @@ async def list_schedules(db: Session = Depends(get_db)):
             except Exception as exc:
                 logger.warning("Forecast fetch failed during schedule list: %s", exc)
 
-        for s, p in needs_eval:
-            try:
-                constraints = _product_constraints(p)
-                forecast_ev = None
-                if hourly:
-                    start_dt = _parse_schedule_datetime(s.planned_date, s.planned_start, tz)
-                    end_dt = _parse_schedule_datetime(s.planned_date, s.planned_end, tz)
-                    forecast_ev = evaluate_conditions(constraints, hourly, start_dt, end_dt)
-                ev = _merged_evaluation(constraints, obs, forecast_ev)
-                s.evaluation = json.dumps(_evaluation_to_dict(ev))
-                rule_go = ev.go
-
-                # AI override: if AI commentary says no-go, it has broader
-                # data sources (HRRR, NWS, radar) and should take precedence.
-                ai_go = _ai_says_go(s.ai_commentary)
-                if rule_go and ai_go is False:
-                    s.status = "no_go"
-                    logger.info(
-                        "Schedule #%d: rule engine says GO but AI says NO-GO — using AI",
-                        s.id,
-                    )
-                else:
-                    s.status = "go" if rule_go else "no_go"
-            except Exception as exc:
-                logger.warning("Re-evaluation failed for schedule #%d: %s", s.id, exc)
+        _reevaluate_schedules(needs_eval, obs, hourly, tz)
         db.commit()
 
     return [_schedule_to_dict(s, p.name) for s, p in rows]
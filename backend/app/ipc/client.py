@@ -6,12 +6,16 @@ live sensor data.  All methods handle connection errors gracefully.
 
 import asyncio
 import logging
+from contextlib import aclosing
 from typing import Any, AsyncIterator
 
 from .protocol import IPC_HOST, encode_message, decode_message
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per read while streaming a subscription.
+SUBSCRIBE_READ_SIZE = 65536
+
 
 class IPCClient:
     """Async TCP client for communicating with the logger daemon."""
@@ -79,6 +83,16 @@ class IPCClient:
         the streaming traffic separate from request/response on the
         shared connection.
         """
+        async with aclosing(self.subscribe_raw()) as lines:
+            async for line in lines:
+                yield decode_message(line)
+
+    async def subscribe_raw(self) -> AsyncIterator[bytes]:
+        """Like subscribe(), but yield each message as undecoded JSON bytes.
+
+        Lets a relay forward messages without parsing and re-encoding
+        them; the trailing newline is stripped.
+        """
         reader, writer = await asyncio.open_connection(IPC_HOST, self.port)
         try:
             writer.write(encode_message({"cmd": "subscribe"}))
@@ -89,12 +103,18 @@ class IPCClient:
             if not ack_line:
                 return
 
-            # Stream sensor updates until disconnected
+            # Stream sensor updates until disconnected.  Read whatever has
+            # arrived in one go and split it, rather than one await per line;
+            # a partial trailing line waits for the next read.
+            pending = b""
             while True:
-                line = await reader.readline()
-                if not line:
+                chunk = await reader.read(SUBSCRIBE_READ_SIZE)
+                if not chunk:
                     break
-                yield decode_message(line)
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    if line:
+                        yield line
         finally:
             try:
                 writer.close()
@@ -24,6 +24,7 @@ CMD_WRITE_CONFIG = "write_config"
 CMD_CLEAR_RAIN_DAILY = "clear_rain_daily"
 CMD_CLEAR_RAIN_YEARLY = "clear_rain_yearly"
 CMD_FORCE_ARCHIVE = "force_archive"
+CMD_RELOAD_UPLOADERS = "reload_uploaders"
 
 # --- Wire helpers ---
 
@@ -38,3 +39,21 @@ def encode_message(msg: dict[str, Any]) -> bytes:
 def decode_message(line: bytes) -> dict[str, Any]:
     """Deserialize a JSON newline-delimited message."""
     return json.loads(line.decode().strip())
+
+
+_TYPE_PREFIX = b'{"type":"'
+
+
+def peek_type(line: bytes) -> str | None:
+    """Return a message's "type" without decoding the whole line.
+
+    encode_message() writes compact JSON, and broadcast messages put
+    "type" first, so the type can be sliced from the prefix.  Anything
+    else falls back to a full decode.
+    """
+    if line.startswith(_TYPE_PREFIX):
+        end = line.find(b'"', len(_TYPE_PREFIX))
+        if end != -1:
+            return line[len(_TYPE_PREFIX):end].decode()
+    msg = decode_message(line)
+    return msg.get("type") if isinstance(msg, dict) else None
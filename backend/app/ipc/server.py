@@ -62,6 +62,10 @@ class IPCServer:
                 logger.warning("IPC server wait_closed timed out")
             logger.info("IPC server stopped")
 
+    def has_subscribers(self) -> bool:
+        """Whether any client is currently subscribed to broadcasts."""
+        return bool(self._subscribers)
+
     async def broadcast_to_subscribers(self, message: dict[str, Any]) -> None:
         """Send a message to all subscribed clients."""
         if not self._subscribers:
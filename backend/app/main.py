@@ -21,8 +21,12 @@ from .ipc.client import IPCClient
 from .ipc.dependencies import set_ipc_client
 from .api.router import api_router
 from .api import backgrounds as backgrounds_api
-from .ws.handler import websocket_endpoint
+from .ws.handler import websocket_endpoint, ws_manager
 from .services.nowcast_service import nowcast_service
+from .services.spray_engine import (
+    close_http_client as close_spray_client,
+    run_forecast_prefetch,
+)
 
 # Configure logging for our app (uvicorn only configures its own loggers)
 logging.basicConfig(
@@ -62,10 +66,19 @@ async def lifespan(app: FastAPI):
     # Start nowcast background service
     nowcast_task = asyncio.create_task(nowcast_service.start())
 
+    # Keep the spray forecast cache warm off the request path
+    spray_prefetch_task = asyncio.create_task(run_forecast_prefetch())
+
+    # Long-lived IPC relay for browser WebSocket clients
+    ws_manager.start()
+
     yield
 
     nowcast_task.cancel()
+    spray_prefetch_task.cancel()
+    await ws_manager.stop()
     await client.close()
+    await close_spray_client()
     logger.info("Application shutdown complete")
 
 
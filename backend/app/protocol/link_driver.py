@@ -453,19 +453,19 @@ class LinkDriver:
     async def async_read_archive(self, address: int, n_bytes: int) -> Optional[bytes]:
         """Async version of read_archive."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_archive, address, n_bytes)
 
     async def async_read_archive_pointers(self) -> Optional[tuple]:
         """Async version of read_archive_pointers."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_archive_pointers)
 
     async def async_read_archive_period(self) -> Optional[int]:
         """Async version of read_archive_period."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_archive_period)
 
     def write_station_memory(
@@ -822,77 +822,77 @@ class LinkDriver:
     async def async_poll_loop(self) -> Optional[SensorReading]:
         """Async version of poll_loop."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.poll_loop)
 
     async def async_detect_station_type(self) -> StationModel:
         """Async version of detect_station_type."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.detect_station_type)
 
     async def async_read_calibration(self) -> CalibrationOffsets:
         """Async version of read_calibration."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_calibration)
 
     async def async_read_station_time(self) -> Optional[dict]:
         """Async version of read_station_time."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_station_time)
 
     async def async_write_station_time(self, dt: datetime) -> bool:
         """Async version of write_station_time."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.write_station_time, dt)
 
     async def async_read_sample_period(self) -> Optional[int]:
         """Async version of read_sample_period."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_sample_period)
 
     async def async_set_archive_period(self, minutes: int) -> bool:
         """Async version of set_archive_period."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.set_archive_period, minutes)
 
     async def async_set_sample_period(self, seconds: int) -> bool:
         """Async version of set_sample_period."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.set_sample_period, seconds)
 
     async def async_write_calibration(self, offsets: CalibrationOffsets) -> bool:
         """Async version of write_calibration."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.write_calibration, offsets)
 
     async def async_read_rain_yearly(self) -> Optional[int]:
         """Async version of read_rain_yearly."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.read_rain_yearly)
 
     async def async_clear_rain_daily(self) -> bool:
         """Async version of clear_rain_daily."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.clear_rain_daily)
 
     async def async_clear_rain_yearly(self) -> bool:
         """Async version of clear_rain_yearly."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.clear_rain_yearly)
 
     async def async_force_archive(self) -> bool:
         """Async version of force_archive."""
         import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.force_archive)
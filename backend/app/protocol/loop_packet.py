@@ -95,11 +95,15 @@ def _valid_uv(value: int) -> Optional[int]:
     return value
 
 
-def parse_loop_packet(raw: bytes, model: StationModel) -> Optional[SensorReading]:
+def parse_loop_packet(
+    raw: bytes | bytearray | memoryview, model: StationModel,
+) -> Optional[SensorReading]:
     """Parse a complete LOOP packet (SOH + data + CRC).
 
     Args:
         raw: Complete packet bytes including SOH header and 2-byte CRC.
+            Any bytes-like object; it is read through a memoryview, so
+            the CRC and data slices below are not copied.
         model: Station model type for format selection.
 
     Returns:
@@ -116,18 +120,18 @@ def parse_loop_packet(raw: bytes, model: StationModel) -> Optional[SensorReading
         return None
 
     # Verify SOH header
-    if raw[0] != SOH:
-        logger.warning("LOOP packet missing SOH header: 0x%02X", raw[0])
+    view = memoryview(raw)
+    if view[0] != SOH:
+        logger.warning("LOOP packet missing SOH header: 0x%02X", view[0])
         return None
 
     # Validate CRC over data bytes + CRC (exclude SOH)
-    data_and_crc = raw[1:expected_total]
-    if not crc_validate(data_and_crc):
+    if not crc_validate(view[1:expected_total]):
         logger.warning("LOOP packet CRC validation failed")
         return None
 
     # Extract data portion (between SOH and CRC)
-    data = raw[1:1 + expected_data_size]
+    data = view[1:1 + expected_data_size]
 
     if model in BASIC_STATIONS:
         return _parse_basic(data)
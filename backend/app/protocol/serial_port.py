@@ -108,17 +108,17 @@ class SerialPort:
 
     async def async_send(self, data: bytes) -> None:
         """Async wrapper for send (runs in thread pool)."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self.send, data)
 
     async def async_receive(self, n: int) -> bytes:
         """Async wrapper for receive (runs in thread pool)."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.receive, n)
 
     async def async_wait_for_ack(self) -> bool:
         """Async wrapper for wait_for_ack."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.wait_for_ack)
 
     def __enter__(self):
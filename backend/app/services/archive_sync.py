@@ -264,7 +264,7 @@ async def async_sync_archive(driver: LinkDriver) -> int:
 
     logger.info("Starting archive sync for %s (record size: %d bytes)", model.name, record_size)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     # 1. Read archive pointers
     pointers = await loop.run_in_executor(None, driver.read_archive_pointers)
@@ -4,8 +4,9 @@ Periodically uploads sensor readings to CWOP/APRS-IS servers using the
 APRS weather packet format over TCP.  Called on every poller broadcast;
 internally rate-limits to the configured interval (default 5 minutes).
 
-Configuration is read from the station_config database table so changes
-made through the Settings UI take effect immediately.
+Configuration is read from the station_config database table and cached
+for CONFIG_TTL seconds; the Settings UI invalidates the cache over IPC so
+changes still take effect immediately.
 
 References:
     http://www.wxqa.com/SIGN-UP.html
@@ -30,6 +31,7 @@ APRS_IS_SERVERS = [
 CONNECT_TIMEOUT = 10.0
 MAX_CONSECUTIVE_ERRORS = 5
 MAX_BACKOFF_INTERVAL = 1800  # 30 minutes
+CONFIG_TTL = 30.0  # seconds between config re-reads from the database
 
 
 def _extract(data: dict, path: tuple[str, ...]) -> Optional[Any]:
@@ -57,6 +59,12 @@ class CwopUploader:
         self._last_upload: float = 0.0
         self._consecutive_errors: int = 0
         self._effective_interval: int = 300
+        self._config_loaded_at: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Last-loaded CWOP enabled flag."""
+        return self._enabled
 
     def reload_config(self) -> None:
         """Read CWOP config from the station_config database table."""
@@ -86,14 +94,27 @@ class CwopUploader:
                 self._latitude = 0.0
                 self._longitude = 0.0
             self._effective_interval = self._upload_interval
+            self._config_loaded_at = time.monotonic()
         except Exception as exc:
             logger.error("Failed to load CWOP config: %s", exc)
         finally:
             db.close()
 
+    def refresh_config(self) -> None:
+        """Reload config if the cached copy is older than CONFIG_TTL."""
+        if (
+            self._config_loaded_at is None
+            or time.monotonic() - self._config_loaded_at > CONFIG_TTL
+        ):
+            self.reload_config()
+
+    def invalidate_config(self) -> None:
+        """Force the next refresh_config() to re-read the database."""
+        self._config_loaded_at = None
+
     async def maybe_upload(self, data: dict) -> None:
         """Called on every sensor broadcast. Upload if enabled and interval elapsed."""
-        self.reload_config()
+        self.refresh_config()
 
         if not self._enabled or not self._callsign:
             return
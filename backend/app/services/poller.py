@@ -7,10 +7,12 @@ stores to database, and broadcasts via a configurable callback.
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Callable, Coroutine, Optional
 
-from sqlalchemy import func
+import serial
+from sqlalchemy import func, select
 
 from ..protocol.link_driver import LinkDriver
 from ..protocol.station_types import SensorReading
@@ -22,7 +24,7 @@ from ..services.calculations import (
     feels_like,
     equivalent_potential_temperature,
 )
-from ..services.pressure_trend import analyze_pressure_trend
+from ..services.pressure_trend import classify_trend
 from ..services.alerts import AlertChecker
 from ..models.database import SessionLocal
 from ..models.sensor_reading import SensorReadingModel
@@ -35,6 +37,31 @@ CARDINAL_DIRECTIONS = [
 
 logger = logging.getLogger(__name__)
 
+# Yearly rain costs an extra serial round-trip, so it is only re-read this
+# often, or sooner when the daily total changes (a bucket tip or a clear).
+YEARLY_RAIN_REFRESH_SEC = 3600
+
+# Routine serial-link hiccups: logged as a one-line warning, no traceback.
+_BENIGN_POLL_ERRORS = (asyncio.TimeoutError, serial.SerialTimeoutException)
+
+
+def _tenths(value: Optional[int]) -> Optional[float]:
+    """Native tenths (temperature, theta-e, UV) to display units."""
+    return value / 10.0 if value is not None else None
+
+
+def _thousandths(value: Optional[int]) -> Optional[float]:
+    """Native thousandths of inHg to inHg."""
+    return value / 1000.0 if value is not None else None
+
+
+def _fill(leaf: dict, value: Any) -> Optional[dict]:
+    """Set an optional {"value", "unit"} leaf, or None when there's no value."""
+    if value is None:
+        return None
+    leaf["value"] = value
+    return leaf
+
 
 class Poller:
     """Manages the LOOP polling lifecycle."""
@@ -43,22 +70,44 @@ class Poller:
         self.driver = driver
         self.poll_interval = poll_interval
         self._running = False
-        self._last_poll: Optional[datetime] = None
+        self._last_poll_ts: Optional[float] = None  # Unix time of last good poll
         self._last_rain_total: Optional[int] = None
-        self._last_rain_tip_time: Optional[datetime] = None
+        # time.monotonic() of the last bucket tip (immune to clock steps)
+        self._last_rain_tip_mono: Optional[float] = None
         self._rain_rate_in_per_hr: float = 0.0
+        self._cached_yearly: Optional[int] = None
+        self._yearly_read_mono: float = 0.0
+        self._yearly_read_rain_total: Optional[int] = None
         self._crc_errors = 0
         self._timeouts = 0
         self._start_time = time.time()
         self._broadcast_callback: (
             Callable[[dict[str, Any]], Coroutine[Any, Any, Any]] | None
         ) = None
+        self._has_subscribers: Callable[[], bool] | None = None
         self._alert_checker = AlertChecker()
+        # Single worker so DB writes stay ordered; keeps SQLite commits
+        # (and their fsync) off the event loop thread.
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db-writer",
+        )
+        # Station identity for DB rows and the broadcast payload; refreshed
+        # only when the driver's detected model changes (connect/reconnect).
+        self._station_model: Optional[StationModel] = None
+        # Reused broadcast payload (see _reading_to_dict)
+        self._payload: Optional[dict] = None
+        self._optional_leaves: dict[str, dict] = {}
+        self._station_type_value = 0
+        self._station_name = "Unknown"
+        self._on_station_change(driver.station_model)
 
     @property
     def stats(self) -> dict:
         return {
-            "last_poll": self._last_poll.isoformat() if self._last_poll else None,
+            "last_poll": (
+                datetime.fromtimestamp(self._last_poll_ts, timezone.utc).isoformat()
+                if self._last_poll_ts is not None else None
+            ),
             "crc_errors": self._crc_errors,
             "timeouts": self._timeouts,
             "uptime_seconds": int(time.time() - self._start_time),
@@ -92,7 +141,7 @@ class Poller:
                 logger.debug("Sending LOOP poll...")
                 reading = await self.driver.async_poll_loop()
                 if reading is not None:
-                    self._last_poll = datetime.now(timezone.utc)
+                    self._last_poll_ts = time.time()
                     logger.info(
                         "LOOP OK: outside_temp=%s wind=%s baro=%s",
                         reading.outside_temp, reading.wind_speed, reading.barometer,
@@ -106,7 +155,11 @@ class Poller:
             except Exception as e:
                 if not self._running:
                     break
-                logger.error("Polling error: %s", e, exc_info=True)
+                if isinstance(e, _BENIGN_POLL_ERRORS):
+                    logger.warning("Polling error: %s", e)
+                else:
+                    logger.error("Polling error: %s", e)
+                    logger.debug("Poll exception", exc_info=True)
                 self._timeouts += 1
 
             try:
@@ -117,66 +170,89 @@ class Poller:
     def set_broadcast_callback(
         self,
         callback: Callable[[dict[str, Any]], Coroutine[Any, Any, Any]],
+        has_subscribers: Callable[[], bool] | None = None,
     ) -> None:
         """Set the async callback invoked after each reading.
 
         In the logger daemon this is IPCServer.broadcast_to_subscribers.
+        If has_subscribers is given and returns False, the broadcast payload
+        is not built and alert checks are skipped for that reading.
         """
         self._broadcast_callback = callback
+        self._has_subscribers = has_subscribers
+
+    def invalidate_rain_yearly(self) -> None:
+        """Force yearly rain to be re-read from the station on the next poll."""
+        self._cached_yearly = None
+
+    def _on_station_change(self, model: Optional[StationModel]) -> None:
+        """Cache the values derived from the station model."""
+        self._station_model = model
+        self._station_type_value = model.value if model else 0
+        self._station_name = STATION_NAMES.get(model, "Unknown") if model else "Unknown"
 
     def stop(self) -> None:
         self._running = False
         self.driver.request_stop()
+        self._db_executor.shutdown(wait=False)
 
     async def _process_reading(self, reading: SensorReading) -> None:
         """Compute derived values, store to DB, broadcast to WS clients."""
+        if self.driver.station_model is not self._station_model:
+            self._on_station_change(self.driver.station_model)
+
         # Compute rain_rate from bucket tips for stations that don't provide it.
         # Uses time-between-tips with decay: rate holds steady until the next
         # expected tip is overdue, then decays toward 0.  After 15 min with no
         # tip, rate drops to 0 (rain stopped).
         if reading.rain_rate is None and reading.rain_total is not None:
-            now = datetime.now(timezone.utc)
+            now = time.monotonic()
 
             if self._last_rain_total is not None:
                 clicks_delta = reading.rain_total - self._last_rain_total
                 if clicks_delta < 0:
                     clicks_delta = 0  # counter wrapped or reset
 
-                if clicks_delta > 0 and self._last_rain_tip_time is not None:
+                if clicks_delta > 0 and self._last_rain_tip_mono is not None:
                     # Bucket tipped — rate from time since last tip
-                    elapsed_hr = (now - self._last_rain_tip_time).total_seconds() / 3600
-                    if elapsed_hr > 0:
-                        self._rain_rate_in_per_hr = (clicks_delta * 0.01) / elapsed_hr
-                    self._last_rain_tip_time = now
+                    elapsed_s = now - self._last_rain_tip_mono
+                    if elapsed_s > 0:
+                        self._rain_rate_in_per_hr = clicks_delta * 36.0 / elapsed_s
+                    self._last_rain_tip_mono = now
                 elif clicks_delta > 0:
                     # First tip since startup — record time, no rate yet
-                    self._last_rain_tip_time = now
-                elif self._last_rain_tip_time is not None:
+                    self._last_rain_tip_mono = now
+                elif self._last_rain_tip_mono is not None:
                     # No new tips — decay: can't be raining faster than
                     # 0.01 / time_waiting or a tip would have occurred
-                    elapsed_s = (now - self._last_rain_tip_time).total_seconds()
+                    elapsed_s = now - self._last_rain_tip_mono
                     if elapsed_s > 900:  # 15 min timeout
                         self._rain_rate_in_per_hr = 0.0
-                    else:
-                        elapsed_hr = elapsed_s / 3600
-                        if elapsed_hr > 0:
-                            self._rain_rate_in_per_hr = min(
-                                self._rain_rate_in_per_hr,
-                                0.01 / elapsed_hr,
-                            )
+                    elif elapsed_s > 0:
+                        # 0.01 in / (elapsed_s / 3600 h) == 36 / elapsed_s
+                        cap = 36.0 / elapsed_s
+                        if cap < self._rain_rate_in_per_hr:
+                            self._rain_rate_in_per_hr = cap
 
             # Convert to native unit (tenths of in/hr)
             reading.rain_rate = round(self._rain_rate_in_per_hr * 10)
             self._last_rain_total = reading.rain_total
 
         # Read yearly rain from station processor memory (separate WRD command)
-        if self.driver.station_model is not None and self._running:
-            try:
-                yearly = await self.driver.async_read_rain_yearly()
-                if yearly is not None:
-                    reading.rain_yearly = yearly
-            except Exception:
-                pass  # non-critical — leave as None
+        if self._station_model is not None and self._running:
+            now = time.monotonic()
+            if (self._cached_yearly is None
+                    or now - self._yearly_read_mono > YEARLY_RAIN_REFRESH_SEC
+                    or reading.rain_total != self._yearly_read_rain_total):
+                try:
+                    yearly = await self.driver.async_read_rain_yearly()
+                    if yearly is not None:
+                        self._cached_yearly = yearly
+                        self._yearly_read_mono = now
+                        self._yearly_read_rain_total = reading.rain_total
+                except Exception:
+                    pass  # non-critical — keep the last known value
+            reading.rain_yearly = self._cached_yearly
 
         # Compute derived values
         hi = None
@@ -186,63 +262,54 @@ class Poller:
         theta = None
         trend = None
 
-        if reading.outside_temp is not None and reading.outside_humidity is not None:
-            hi = heat_index(reading.outside_temp, reading.outside_humidity)
-            dp = dew_point(reading.outside_temp, reading.outside_humidity)
-
-            if reading.barometer is not None:
-                theta = equivalent_potential_temperature(
-                    reading.outside_temp, reading.outside_humidity, reading.barometer
-                )
-
-        if reading.outside_temp is not None and reading.wind_speed is not None:
-            wc = wind_chill(reading.outside_temp, reading.wind_speed)
-
-        if (reading.outside_temp is not None
-                and reading.outside_humidity is not None
-                and reading.wind_speed is not None):
-            fl = feels_like(
-                reading.outside_temp, reading.outside_humidity, reading.wind_speed
-            )
+        t = reading.outside_temp
+        h = reading.outside_humidity
+        w = reading.wind_speed
+        if t is not None:
+            if h is not None:
+                hi = heat_index(t, h)
+                dp = dew_point(t, h)
+                if reading.barometer is not None:
+                    theta = equivalent_potential_temperature(t, h, reading.barometer)
+            if w is not None:
+                wc = wind_chill(t, w)
+                if h is not None:
+                    fl = feels_like(t, h, w)
 
         # Pressure trend from recent history
         trend = await self._get_pressure_trend()
 
         # Store to database
-        db = SessionLocal()
-        try:
-            model = SensorReadingModel(
-                timestamp=datetime.now(timezone.utc),
-                station_type=self.driver.station_model.value if self.driver.station_model else 0,
-                inside_temp=reading.inside_temp,
-                outside_temp=reading.outside_temp,
-                inside_humidity=reading.inside_humidity,
-                outside_humidity=reading.outside_humidity,
-                wind_speed=reading.wind_speed,
-                wind_direction=reading.wind_direction,
-                barometer=reading.barometer,
-                rain_total=reading.rain_total,
-                rain_rate=reading.rain_rate,
-                rain_yearly=reading.rain_yearly,
-                solar_radiation=reading.solar_radiation,
-                uv_index=reading.uv_index,
-                heat_index=hi,
-                dew_point=dp,
-                wind_chill=wc,
-                feels_like=fl,
-                theta_e=theta,
-                pressure_trend=trend,
-            )
-            db.add(model)
-            db.commit()
-
-            # Query daily extremes while session is open
-            extremes = self._get_daily_extremes(db)
-        finally:
-            db.close()
+        model = SensorReadingModel(
+            timestamp=datetime.now(timezone.utc),
+            station_type=self._station_type_value,
+            inside_temp=reading.inside_temp,
+            outside_temp=reading.outside_temp,
+            inside_humidity=reading.inside_humidity,
+            outside_humidity=reading.outside_humidity,
+            wind_speed=reading.wind_speed,
+            wind_direction=reading.wind_direction,
+            barometer=reading.barometer,
+            rain_total=reading.rain_total,
+            rain_rate=reading.rain_rate,
+            rain_yearly=reading.rain_yearly,
+            solar_radiation=reading.solar_radiation,
+            uv_index=reading.uv_index,
+            heat_index=hi,
+            dew_point=dp,
+            wind_chill=wc,
+            feels_like=fl,
+            theta_e=theta,
+            pressure_trend=trend,
+        )
+        loop = asyncio.get_running_loop()
+        extremes = await loop.run_in_executor(
+            self._db_executor, self._write_reading, model,
+        )
 
         # Broadcast to subscribers (IPC clients / WebSocket relay)
-        if self._broadcast_callback:
+        if self._broadcast_callback and (
+                self._has_subscribers is None or self._has_subscribers()):
             data_dict = self._reading_to_dict(reading, hi, dp, wc, fl, theta, trend, extremes)
             await self._broadcast_callback({
                 "type": "sensor_update",
@@ -263,28 +330,49 @@ class Poller:
                     "data": alert,
                 })
 
+    def _write_reading(self, model: SensorReadingModel) -> Optional[dict]:
+        """Insert a reading and return today's extremes. Runs on the DB executor."""
+        db = SessionLocal()
+        try:
+            db.add(model)
+            db.commit()
+
+            # Query daily extremes while session is open
+            return self._get_daily_extremes(db)
+        finally:
+            db.close()
+
     async def _get_pressure_trend(self) -> Optional[str]:
-        """Query last 3 hours of barometer readings for trend analysis."""
+        """Pressure trend label, queried on the DB executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, self._query_pressure_trend)
+
+    def _query_pressure_trend(self) -> Optional[str]:
+        """Query the oldest and newest barometer readings of the last 3 hours.
+
+        The trend only depends on the endpoints of the window, so fetch those
+        two rows via the timestamp index instead of the whole window.
+        """
         db = SessionLocal()
         try:
-            cutoff = datetime.now(timezone.utc).timestamp() - 3 * 3600
-            results = (
-                db.query(
-                    SensorReadingModel.timestamp,
-                    SensorReadingModel.barometer,
-                )
-                .filter(SensorReadingModel.barometer.isnot(None))
-                .filter(SensorReadingModel.timestamp >= datetime.fromtimestamp(cutoff, tz=timezone.utc))
-                .order_by(SensorReadingModel.timestamp)
-                .all()
+            S = SensorReadingModel
+            cutoff = datetime.fromtimestamp(
+                datetime.now(timezone.utc).timestamp() - 3 * 3600, tz=timezone.utc,
             )
+            # Core select: plain Row tuples, no ORM query/identity-map overhead
+            window = select(S.timestamp, S.barometer).where(
+                S.barometer.isnot(None), S.timestamp >= cutoff,
+            )
+            first = db.execute(window.order_by(S.timestamp).limit(1)).first()
+            last = db.execute(window.order_by(S.timestamp.desc()).limit(1)).first()
 
-            if len(results) < 2:
+            if first is None or last is None:
                 return None
 
-            readings = [(r.timestamp.timestamp(), r.barometer) for r in results]
-            result = analyze_pressure_trend(readings)
-            return result.trend if result else None
+            return classify_trend(
+                first.timestamp.timestamp(), first.barometer,
+                last.timestamp.timestamp(), last.barometer,
+            )
         finally:
             db.close()
 
@@ -352,65 +440,106 @@ class Poller:
 
         Format matches the REST /api/current response so the frontend
         can use the same CurrentConditions type for both sources.
-        """
-        def temp_f(tenths: Optional[int]) -> Optional[float]:
-            return tenths / 10.0 if tenths is not None else None
-
-        def bar_inhg(thousandths: Optional[int]) -> Optional[float]:
-            return thousandths / 1000.0 if thousandths is not None else None
 
-        model = self.driver.station_model
-        station_name = STATION_NAMES.get(model, "Unknown") if model else "Unknown"
+        The nested structure (units, keys) is built once and only the
+        values are updated per poll, so the returned dict is reused:
+        consumers must serialize or copy what they need before the next
+        poll rather than keep a reference.
+        """
+        if self._payload is None:
+            self._payload = self._new_payload()
+        p = self._payload
+        leaves = self._optional_leaves
+
+        p["timestamp"] = datetime.now(timezone.utc).isoformat()
+        p["station_type"] = self._station_name
+
+        temperature = p["temperature"]
+        temperature["inside"]["value"] = _tenths(reading.inside_temp)
+        temperature["outside"]["value"] = _tenths(reading.outside_temp)
+
+        humidity = p["humidity"]
+        humidity["inside"]["value"] = reading.inside_humidity
+        humidity["outside"]["value"] = reading.outside_humidity
+
+        wind = p["wind"]
+        wind["speed"]["value"] = reading.wind_speed
+        wind["direction"]["value"] = reading.wind_direction
+        wind["cardinal"] = self._cardinal(reading.wind_direction)
+
+        barometer = p["barometer"]
+        barometer["value"] = _thousandths(reading.barometer)
+        barometer["trend"] = trend
+
+        rain = p["rain"]
+        rain["daily"] = _fill(
+            leaves["rain_daily"],
+            round(reading.rain_total * 0.01, 2) if reading.rain_total is not None else None,
+        )
+        rain["yearly"] = _fill(
+            leaves["rain_yearly"],
+            round(reading.rain_yearly * 0.01, 2) if reading.rain_yearly is not None else None,
+        )
+        rain["rate"] = _fill(
+            leaves["rain_rate"],
+            round(reading.rain_rate / 10.0, 2) if reading.rain_rate is not None else None,
+        )
 
+        derived = p["derived"]
+        derived["heat_index"]["value"] = _tenths(hi)
+        derived["dew_point"]["value"] = _tenths(dp)
+        derived["wind_chill"]["value"] = _tenths(wc)
+        derived["feels_like"]["value"] = _tenths(fl)
+        derived["theta_e"]["value"] = _tenths(theta)
+
+        p["solar_radiation"] = _fill(leaves["solar_radiation"], reading.solar_radiation)
+        p["uv_index"] = _fill(leaves["uv_index"], _tenths(reading.uv_index))
+        p["daily_extremes"] = extremes
+        return p
+
+    def _new_payload(self) -> dict:
+        """Build the static skeleton of the broadcast payload."""
+        self._optional_leaves = {
+            "rain_daily": {"value": None, "unit": "in"},
+            "rain_yearly": {"value": None, "unit": "in"},
+            "rain_rate": {"value": None, "unit": "in/hr"},
+            "solar_radiation": {"value": None, "unit": "W/m²"},
+            "uv_index": {"value": None, "unit": ""},
+        }
         return {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "station_type": station_name,
+            "timestamp": None,
+            "station_type": self._station_name,
             "temperature": {
-                "inside": {"value": temp_f(reading.inside_temp), "unit": "F"},
-                "outside": {"value": temp_f(reading.outside_temp), "unit": "F"},
+                "inside": {"value": None, "unit": "F"},
+                "outside": {"value": None, "unit": "F"},
             },
             "humidity": {
-                "inside": {"value": reading.inside_humidity, "unit": "%"},
-                "outside": {"value": reading.outside_humidity, "unit": "%"},
+                "inside": {"value": None, "unit": "%"},
+                "outside": {"value": None, "unit": "%"},
             },
             "wind": {
-                "speed": {"value": reading.wind_speed, "unit": "mph"},
-                "direction": {"value": reading.wind_direction, "unit": "°"},
-                "cardinal": self._cardinal(reading.wind_direction),
+                "speed": {"value": None, "unit": "mph"},
+                "direction": {"value": None, "unit": "°"},
+                "cardinal": None,
             },
             "barometer": {
-                "value": bar_inhg(reading.barometer),
+                "value": None,
                 "unit": "inHg",
-                "trend": trend,
+                "trend": None,
             },
             "rain": {
-                "daily": (
-                    {"value": round(reading.rain_total * 0.01, 2), "unit": "in"}
-                    if reading.rain_total is not None else None
-                ),
-                "yearly": (
-                    {"value": round(reading.rain_yearly * 0.01, 2), "unit": "in"}
-                    if reading.rain_yearly is not None else None
-                ),
-                "rate": (
-                    {"value": round(reading.rain_rate / 10.0, 2), "unit": "in/hr"}
-                    if reading.rain_rate is not None else None
-                ),
+                "daily": None,
+                "yearly": None,
+                "rate": None,
             },
             "derived": {
-                "heat_index": {"value": temp_f(hi), "unit": "F"},
-                "dew_point": {"value": temp_f(dp), "unit": "F"},
-                "wind_chill": {"value": temp_f(wc), "unit": "F"},
-                "feels_like": {"value": temp_f(fl), "unit": "F"},
-                "theta_e": {"value": theta / 10.0 if theta is not None else None, "unit": "K"},
+                "heat_index": {"value": None, "unit": "F"},
+                "dew_point": {"value": None, "unit": "F"},
+                "wind_chill": {"value": None, "unit": "F"},
+                "feels_like": {"value": None, "unit": "F"},
+                "theta_e": {"value": None, "unit": "K"},
             },
-            "solar_radiation": (
-                {"value": reading.solar_radiation, "unit": "W/m²"}
-                if reading.solar_radiation is not None else None
-            ),
-            "uv_index": (
-                {"value": reading.uv_index / 10.0 if reading.uv_index is not None else None, "unit": ""}
-                if reading.uv_index is not None else None
-            ),
-            "daily_extremes": extremes,
+            "solar_radiation": None,
+            "uv_index": None,
+            "daily_extremes": None,
         }
@@ -23,6 +23,30 @@ class PressureTrend:
     rate_per_hour: float  # Change rate in thousandths inHg per hour
 
 
+def classify_trend(
+    oldest_time: float,
+    oldest_bar: int,
+    newest_time: float,
+    newest_bar: int,
+) -> Optional[str]:
+    """Classify the trend between two readings without building a PressureTrend.
+
+    Used by the poller, which only needs the trend label each cycle.
+
+    Returns:
+        "rising", "falling", "steady", or None if the readings don't span
+        a positive time interval.
+    """
+    if newest_time <= oldest_time:
+        return None
+    change = newest_bar - oldest_bar
+    if change > TREND_THRESHOLD:
+        return "rising"
+    if change < -TREND_THRESHOLD:
+        return "falling"
+    return "steady"
+
+
 def analyze_pressure_trend(
     readings: list[tuple[float, int]],
 ) -> Optional[PressureTrend]:
@@ -42,18 +66,11 @@ def analyze_pressure_trend(
     oldest_time, oldest_bar = readings[0]
     newest_time, newest_bar = readings[-1]
 
-    elapsed_hours = (newest_time - oldest_time) / 3600.0
-    if elapsed_hours <= 0:
+    trend = classify_trend(oldest_time, oldest_bar, newest_time, newest_bar)
+    if trend is None:
         return None
 
     change = newest_bar - oldest_bar
-    rate = change / elapsed_hours
-
-    if change > TREND_THRESHOLD:
-        trend = "rising"
-    elif change < -TREND_THRESHOLD:
-        trend = "falling"
-    else:
-        trend = "steady"
+    rate = change / ((newest_time - oldest_time) / 3600.0)
 
     return PressureTrend(trend=trend, change=change, rate_per_hour=round(rate, 1))
@@ -5,14 +5,21 @@ observations to produce go/no-go recommendations and find optimal windows.
 Also holds preset product definitions and seeding logic.
 """
 
+import asyncio
 import logging
+import math
 import time
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from itertools import groupby, islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import httpx
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -31,23 +38,49 @@ SPRAY_HOURLY_VARS = [
     "wind_gusts_10m",
 ]
 
-# Simple in-memory forecast cache (15-minute TTL).
-_forecast_cache: dict[str, Any] = {"data": None, "expires": 0.0}
+# Shared client so repeated forecast fetches reuse the keep-alive connection.
+_http_client: Optional[httpx.AsyncClient] = None
+
+# In-memory forecast cache keyed by (lat, lon, hours), least recently used
+# first.  Entries expire after 15 minutes (monotonic clock); once expired,
+# callers get the stale copy while one background task per key refreshes it.
+ForecastKey = tuple[float, float, int]
+_forecast_cache: OrderedDict[ForecastKey, dict[str, Any]] = OrderedDict()
 FORECAST_CACHE_TTL = 900  # 15 minutes
+FORECAST_CACHE_MAXSIZE = 16
+_refresh_tasks: dict[ForecastKey, asyncio.Task] = {}
+# Serialises cold-cache fetches so concurrent evaluations share one request.
+_fetch_lock = asyncio.Lock()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Open-Meteo client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=OPEN_METEO_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _http_client
 
 
-async def fetch_hourly_forecast(
-    lat: float, lon: float, hours: int = 48,
-) -> dict[str, list]:
-    """Fetch hourly forecast from Open-Meteo for spray evaluation.
+async def close_http_client() -> None:
+    """Close the shared Open-Meteo client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _forecast_key(lat: float, lon: float, hours: int) -> ForecastKey:
+    """Cache key; coordinates are rounded to ~100 m."""
+    return (round(lat, 3), round(lon, 3), hours)
 
-    Returns a dict with keys matching SPRAY_HOURLY_VARS plus 'time',
-    each containing a list of hourly values. Cached for 15 minutes.
-    """
-    now = time.time()
-    if _forecast_cache["data"] is not None and now < _forecast_cache["expires"]:
-        return _forecast_cache["data"]
 
+async def _refetch_forecast(
+    lat: float, lon: float, hours: int,
+) -> Optional[dict[str, list]]:
+    """Fetch from Open-Meteo and store in the cache. Returns None on failure."""
     params = {
         "latitude": lat,
         "longitude": lon,
@@ -58,19 +91,98 @@ async def fetch_hourly_forecast(
         "precipitation_unit": "inch",
     }
     try:
-        async with httpx.AsyncClient(timeout=OPEN_METEO_TIMEOUT) as client:
-            resp = await client.get(OPEN_METEO_URL, params=params)
-            resp.raise_for_status()
-            hourly = resp.json().get("hourly", {})
-            _forecast_cache["data"] = hourly
-            _forecast_cache["expires"] = now + FORECAST_CACHE_TTL
-            return hourly
+        resp = await _get_http_client().get(OPEN_METEO_URL, params=params)
+        resp.raise_for_status()
+        hourly = resp.json().get("hourly", {})
     except Exception as exc:
         logger.warning("Spray forecast fetch failed: %s", exc)
-        # Return cached data if available even if expired.
-        if _forecast_cache["data"] is not None:
-            return _forecast_cache["data"]
-        return {}
+        return None
+    key = _forecast_key(lat, lon, hours)
+    _forecast_cache[key] = {
+        "data": hourly,
+        "expires": time.monotonic() + FORECAST_CACHE_TTL,
+    }
+    _forecast_cache.move_to_end(key)
+    while len(_forecast_cache) > FORECAST_CACHE_MAXSIZE:
+        evicted, _ = _forecast_cache.popitem(last=False)
+        _refresh_tasks.pop(evicted, None)
+    return hourly
+
+
+async def fetch_hourly_forecast(
+    lat: float, lon: float, hours: int = 48,
+) -> dict[str, list]:
+    """Fetch hourly forecast from Open-Meteo for spray evaluation.
+
+    Returns a dict with keys matching SPRAY_HOURLY_VARS plus 'time',
+    each containing a list of hourly values. Cached per location for
+    15 minutes; after that the stale copy is served while a refresh
+    runs in the background.
+    """
+    key = _forecast_key(lat, lon, hours)
+    entry = _forecast_cache.get(key)
+    if entry is not None:
+        _forecast_cache.move_to_end(key)
+        task = _refresh_tasks.get(key)
+        if time.monotonic() >= entry["expires"] and (task is None or task.done()):
+            _refresh_tasks[key] = asyncio.create_task(
+                _refetch_forecast(lat, lon, hours)
+            )
+        return entry["data"]
+
+    async with _fetch_lock:
+        # Another caller may have filled the cache while we waited.
+        entry = _forecast_cache.get(key)
+        if entry is not None:
+            return entry["data"]
+        hourly = await _refetch_forecast(lat, lon, hours)
+    return hourly if hourly is not None else {}
+
+
+FORECAST_PREFETCH_INTERVAL = 600  # 10 minutes, inside the cache TTL
+
+
+def _station_location() -> Optional[tuple[float, float]]:
+    """Configured station lat/lon, or None if no location is set."""
+    from ..models.database import SessionLocal
+    from ..models.station_config import StationConfigModel
+
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(StationConfigModel)
+            .filter(StationConfigModel.key.in_(["latitude", "longitude"]))
+            .all()
+        )
+    finally:
+        db.close()
+    cfg = {r.key: r.value for r in rows}
+    try:
+        lat = float(cfg.get("latitude", "0"))
+        lon = float(cfg.get("longitude", "0"))
+    except ValueError:
+        return None
+    if lat == 0.0 and lon == 0.0:
+        return None
+    return lat, lon
+
+
+async def run_forecast_prefetch() -> None:
+    """Keep the station's spray forecast warm — runs forever as a background task.
+
+    Refreshes the default (48-hour) forecast for the configured location
+    every FORECAST_PREFETCH_INTERVAL, so spray endpoints are served from
+    the cache instead of waiting on Open-Meteo.
+    """
+    logger.info("Spray forecast prefetch started")
+    while True:
+        try:
+            location = _station_location()
+            if location is not None:
+                await _refetch_forecast(*location, hours=48)
+        except Exception:
+            logger.exception("Spray forecast prefetch failed")
+        await asyncio.sleep(FORECAST_PREFETCH_INTERVAL)
 
 
 # ---------------------------------------------------------------------------
@@ -107,6 +219,125 @@ class ProductConstraints:
     min_humidity_pct: Optional[float] = None
     max_humidity_pct: Optional[float] = None
 
+    @cached_property
+    def threshold_labels(self) -> dict[str, str]:
+        """Human-readable threshold strings, formatted once per product."""
+        lo = f"{self.min_humidity_pct:.0f}" if self.min_humidity_pct is not None else "any"
+        hi = f"{self.max_humidity_pct:.0f}" if self.max_humidity_pct is not None else "any"
+        return {
+            "wind": f"<{self.max_wind_mph} mph",
+            "temperature": f"{self.min_temp_f}-{self.max_temp_f}\u00B0F",
+            "humidity": f"{lo}-{hi}%",
+            "humidity_unknown": (
+                f"{self.min_humidity_pct or 'any'}-{self.max_humidity_pct or 'any'}%"
+            ),
+            "rain_free": f"{self.rain_free_hours}h rain-free",
+        }
+
+    @cached_property
+    def rf_hours_int(self) -> int:
+        """Rain-free requirement rounded up to whole forecast hours."""
+        return math.ceil(self.rain_free_hours)
+
+    @property
+    def has_humidity_limits(self) -> bool:
+        """True if the product sets either humidity bound."""
+        return self.min_humidity_pct is not None or self.max_humidity_pct is not None
+
+    def active_checks(self) -> list["WindowCheck"]:
+        """Window checks that apply to this product, in report order.
+
+        Humidity is skipped entirely when the product sets no humidity
+        limits (the default for every preset).
+        """
+        checks: list[WindowCheck] = [_window_wind, _window_temperature]
+        if self.has_humidity_limits:
+            checks.append(_window_humidity)
+        checks.append(_window_rain_free)
+        return checks
+
+
+def _extent(values: Iterable[float]) -> tuple[Optional[float], Optional[float]]:
+    """(min, max) of values in a single pass, or (None, None) if empty."""
+    lo = hi = None
+    for v in values:
+        if lo is None:
+            lo = hi = v
+        elif v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
+def _mean(values: Iterable[float]) -> Optional[float]:
+    """Arithmetic mean of values, or None if empty."""
+    total = 0.0
+    count = 0
+    for v in values:
+        total += v
+        count += 1
+    return total / count if count else None
+
+
+@dataclass
+class ForecastWindow:
+    """Hourly forecast series plus the index range of an application window.
+
+    Reductions are memoised per window, so products evaluated over the
+    same hours (see evaluate_many) share them.
+    """
+    hourly: dict[str, list]
+    start_idx: int
+    end_idx: int
+    _memo: dict[tuple[str, str], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def _values(self, var: str) -> Iterator[float]:
+        """Non-None values of var within the window, without copying."""
+        values = self.hourly.get(var) or []
+        for v in islice(values, self.start_idx, self.end_idx + 1):
+            if v is not None:
+                yield v
+
+    def _reduce(self, kind: str, var: str, fn: Callable[[Iterator[float]], Any]) -> Any:
+        key = (kind, var)
+        if key not in self._memo:
+            self._memo[key] = fn(self._values(var))
+        return self._memo[key]
+
+    def extent(self, var: str) -> tuple[Optional[float], Optional[float]]:
+        """(min, max) of var within the window in a single pass."""
+        return self._reduce("extent", var, _extent)
+
+    def mean(self, var: str) -> Optional[float]:
+        """Mean of var within the window, or None if no data."""
+        return self._reduce("mean", var, _mean)
+
+    def peak_wind(self) -> tuple[Optional[float], bool]:
+        """Max per-hour effective wind (gust if reported, else sustained).
+
+        Returns (value, from_gust); value is None if no wind data.
+        """
+        key = ("peak_wind", "")
+        if key not in self._memo:
+            gusts = self.hourly.get("wind_gusts_10m") or []
+            winds = self.hourly.get("wind_speed_10m") or []
+            n_gusts, n_winds = len(gusts), len(winds)
+            peak: Optional[float] = None
+            from_gust = False
+            for i in range(self.start_idx, self.end_idx + 1):
+                g = gusts[i] if i < n_gusts else None
+                v = g if g is not None else (winds[i] if i < n_winds else None)
+                if v is not None and (peak is None or v > peak):
+                    peak, from_gust = v, g is not None
+            self._memo[key] = (peak, from_gust)
+        return self._memo[key]
+
+
+WindowCheck = Callable[[ProductConstraints, ForecastWindow], ConstraintCheck]
+
 
 # ---------------------------------------------------------------------------
 # Preset products
@@ -177,12 +408,10 @@ def seed_presets(db: Session) -> int:
     existing = db.query(SprayProduct).filter(SprayProduct.is_preset == 1).count()
     if existing > 0:
         return 0
-    count = 0
-    for preset in PRESET_PRODUCTS:
-        product = SprayProduct(is_preset=1, **preset)
-        db.add(product)
-        count += 1
+    rows = [{"is_preset": 1, **preset} for preset in PRESET_PRODUCTS]
+    db.execute(insert(SprayProduct), rows)
     db.commit()
+    count = len(rows)
     logger.info("Seeded %d preset spray products", count)
     return count
 
@@ -194,14 +423,16 @@ def seed_presets(db: Session) -> int:
 def _check_wind(
     forecast_wind: Optional[float],
     forecast_gust: Optional[float],
-    max_wind: float,
+    constraints: ProductConstraints,
 ) -> ConstraintCheck:
     """Check wind speed constraint. Uses gust if available, else sustained."""
+    max_wind = constraints.max_wind_mph
+    threshold = constraints.threshold_labels["wind"]
     effective = forecast_gust if forecast_gust is not None else forecast_wind
     if effective is None:
         return ConstraintCheck(
             name="wind", passed=True,
-            current_value="N/A", threshold=f"<{max_wind} mph",
+            current_value="N/A", threshold=threshold,
             detail="No wind data available; assuming OK.",
         )
     passed = effective <= max_wind
@@ -209,7 +440,7 @@ def _check_wind(
     return ConstraintCheck(
         name="wind", passed=passed,
         current_value=f"{effective:.0f} mph ({label})",
-        threshold=f"<{max_wind} mph",
+        threshold=threshold,
         detail=(
             f"Wind {effective:.0f} mph {'within' if passed else 'exceeds'} "
             f"{max_wind} mph limit."
@@ -219,21 +450,23 @@ def _check_wind(
 
 def _check_temperature(
     forecast_temp: Optional[float],
-    min_temp: float,
-    max_temp: float,
+    constraints: ProductConstraints,
 ) -> ConstraintCheck:
     """Check temperature range constraint."""
+    min_temp = constraints.min_temp_f
+    max_temp = constraints.max_temp_f
+    threshold = constraints.threshold_labels["temperature"]
     if forecast_temp is None:
         return ConstraintCheck(
             name="temperature", passed=True,
-            current_value="N/A", threshold=f"{min_temp}-{max_temp}\u00B0F",
+            current_value="N/A", threshold=threshold,
             detail="No temperature data available; assuming OK.",
         )
     passed = min_temp <= forecast_temp <= max_temp
     return ConstraintCheck(
         name="temperature", passed=passed,
         current_value=f"{forecast_temp:.0f}\u00B0F",
-        threshold=f"{min_temp}-{max_temp}\u00B0F",
+        threshold=threshold,
         detail=(
             f"Temperature {forecast_temp:.0f}\u00B0F {'within' if passed else 'outside'} "
             f"range {min_temp}-{max_temp}\u00B0F."
@@ -243,31 +476,32 @@ def _check_temperature(
 
 def _check_humidity(
     forecast_humidity: Optional[float],
-    min_hum: Optional[float],
-    max_hum: Optional[float],
+    constraints: ProductConstraints,
 ) -> Optional[ConstraintCheck]:
     """Check humidity constraint. Returns None if no humidity limits set."""
-    if min_hum is None and max_hum is None:
+    if not constraints.has_humidity_limits:
         return None
+    min_hum = constraints.min_humidity_pct
+    max_hum = constraints.max_humidity_pct
+    labels = constraints.threshold_labels
     if forecast_humidity is None:
         return ConstraintCheck(
             name="humidity", passed=True,
             current_value="N/A",
-            threshold=f"{min_hum or 'any'}-{max_hum or 'any'}%",
+            threshold=labels["humidity_unknown"],
             detail="No humidity data available; assuming OK.",
         )
     low_ok = forecast_humidity >= min_hum if min_hum is not None else True
     high_ok = forecast_humidity <= max_hum if max_hum is not None else True
     passed = low_ok and high_ok
-    lo = f"{min_hum:.0f}" if min_hum is not None else "any"
-    hi = f"{max_hum:.0f}" if max_hum is not None else "any"
+    threshold = labels["humidity"]
     return ConstraintCheck(
         name="humidity", passed=passed,
         current_value=f"{forecast_humidity:.0f}%",
-        threshold=f"{lo}-{hi}%",
+        threshold=threshold,
         detail=(
             f"Humidity {forecast_humidity:.0f}% {'within' if passed else 'outside'} "
-            f"range {lo}-{hi}%."
+            f"range {threshold}."
         ),
     )
 
@@ -275,10 +509,12 @@ def _check_humidity(
 def _check_rain_free(
     hourly_precip: list[float],
     start_idx: int,
-    rain_free_hours: float,
+    constraints: ProductConstraints,
 ) -> ConstraintCheck:
     """Check that no precipitation is forecast for rain_free_hours after start."""
-    hours_needed = int(rain_free_hours + 0.99)  # round up
+    rain_free_hours = constraints.rain_free_hours
+    threshold = constraints.threshold_labels["rain_free"]
+    hours_needed = constraints.rf_hours_int
     end_idx = min(start_idx + hours_needed, len(hourly_precip))
     window = hourly_precip[start_idx:end_idx]
 
@@ -286,7 +522,7 @@ def _check_rain_free(
         return ConstraintCheck(
             name="rain_free", passed=True,
             current_value="No forecast data",
-            threshold=f"{rain_free_hours}h rain-free",
+            threshold=threshold,
             detail="Insufficient forecast data for rain-free check.",
         )
 
@@ -314,7 +550,7 @@ def _check_rain_free(
     return ConstraintCheck(
         name="rain_free", passed=passed,
         current_value=f"{total_precip:.2f}\" in {len(window)}h",
-        threshold=f"{rain_free_hours}h rain-free",
+        threshold=threshold,
         detail=detail,
     )
 
@@ -330,76 +566,30 @@ def _find_hour_index(
         "Rain-free lookup: target=%s, forecast range=%s..%s",
         target_str, times[0] if times else "?", times[-1] if times else "?",
     )
-    for i, t in enumerate(times):
-        if t >= target_str:
-            return i
-    return len(times) - 1
+    # Open-Meteo hour strings sort chronologically, so bisect finds the
+    # first hour at or after the target.
+    return min(bisect_left(times, target_str), len(times) - 1)
 
 
-def evaluate_conditions(
-    constraints: ProductConstraints,
-    hourly: dict[str, list],
-    planned_start: datetime,
-    planned_end: datetime,
-) -> SprayEvaluation:
-    """Evaluate spray constraints against hourly forecast for a time window.
+# Window checks: worst-case forecast values across the application window.
 
-    Args:
-        constraints: Product constraint values.
-        hourly: Open-Meteo hourly forecast dict with 'time' and variable lists.
-        planned_start: Start of planned application window (UTC).
-        planned_end: End of planned application window (UTC).
+def _window_wind(c: ProductConstraints, w: ForecastWindow) -> ConstraintCheck:
+    effective, from_gust = w.peak_wind()
+    return _check_wind(effective, effective if from_gust else None, c)
 
-    Returns:
-        SprayEvaluation with per-constraint results and overall go/no-go.
-    """
-    times = hourly.get("time", [])
-    temps = hourly.get("temperature_2m", [])
-    humidities = hourly.get("relative_humidity_2m", [])
-    precips = hourly.get("precipitation", [])
-    winds = hourly.get("wind_speed_10m", [])
-    gusts = hourly.get("wind_gusts_10m", [])
 
-    if not times:
-        return SprayEvaluation(
-            go=False,
-            constraints=[],
-            overall_detail="No forecast data available for evaluation.",
-            confidence="LOW",
-        )
-
-    start_idx = _find_hour_index(times, planned_start)
-    end_idx = _find_hour_index(times, planned_end)
-
-    # Use worst-case values across the application window.
-    window_slice = slice(start_idx, end_idx + 1)
-
-    def _worst(values: list, fn):
-        subset = values[window_slice] if values else []
-        valid = [v for v in subset if v is not None]
-        return fn(valid) if valid else None
-
-    max_wind = _worst(winds, max)
-    max_gust = _worst(gusts, max)
-    # For temp, check both min and max across window.
-    min_temp_val = _worst(temps, min)
-    max_temp_val = _worst(temps, max)
-    avg_humidity = _worst(humidities, lambda v: sum(v) / len(v))
+def _window_temperature(c: ProductConstraints, w: ForecastWindow) -> ConstraintCheck:
+    """Fail if any hour in the window falls outside the temperature range."""
+    min_temp_val, max_temp_val = w.extent("temperature_2m")
 
-    checks: list[ConstraintCheck] = []
-
-    # Wind — use worst case.
-    checks.append(_check_wind(max_wind, max_gust, constraints.max_wind_mph))
-
-    # Temperature — check if any hour falls outside range.
     temp_passed = True
     temp_detail_parts = []
-    if min_temp_val is not None and min_temp_val < constraints.min_temp_f:
+    if min_temp_val is not None and min_temp_val < c.min_temp_f:
         temp_passed = False
-        temp_detail_parts.append(f"Low of {min_temp_val:.1f}\u00B0F below {constraints.min_temp_f}\u00B0F minimum.")
-    if max_temp_val is not None and max_temp_val > constraints.max_temp_f:
+        temp_detail_parts.append(f"Low of {min_temp_val:.1f}\u00B0F below {c.min_temp_f}\u00B0F minimum.")
+    if max_temp_val is not None and max_temp_val > c.max_temp_f:
         temp_passed = False
-        temp_detail_parts.append(f"High of {max_temp_val:.1f}\u00B0F above {constraints.max_temp_f}\u00B0F maximum.")
+        temp_detail_parts.append(f"High of {max_temp_val:.1f}\u00B0F above {c.max_temp_f}\u00B0F maximum.")
     if temp_passed:
         temp_range_str = (
             f"{min_temp_val:.1f}-{max_temp_val:.1f}\u00B0F"
@@ -408,26 +598,100 @@ def evaluate_conditions(
         )
         temp_detail_parts.append(f"Temperature {temp_range_str} within range.")
 
-    checks.append(ConstraintCheck(
+    return ConstraintCheck(
         name="temperature", passed=temp_passed,
         current_value=(
             f"{min_temp_val:.1f}-{max_temp_val:.1f}\u00B0F"
             if min_temp_val is not None and max_temp_val is not None
             else "N/A"
         ),
-        threshold=f"{constraints.min_temp_f}-{constraints.max_temp_f}\u00B0F",
+        threshold=c.threshold_labels["temperature"],
         detail=" ".join(temp_detail_parts),
-    ))
+    )
+
+
+def _window_humidity(c: ProductConstraints, w: ForecastWindow) -> ConstraintCheck:
+    avg_humidity = w.mean("relative_humidity_2m")
+    return _check_humidity(avg_humidity, c)
+
+
+def _window_rain_free(c: ProductConstraints, w: ForecastWindow) -> ConstraintCheck:
+    return _check_rain_free(w.hourly.get("precipitation", []), w.start_idx, c)
+
+
+def evaluate_conditions(
+    constraints: ProductConstraints,
+    hourly: dict[str, list],
+    planned_start: datetime,
+    planned_end: datetime,
+) -> SprayEvaluation:
+    """Evaluate spray constraints against hourly forecast for a time window.
+
+    Args:
+        constraints: Product constraint values.
+        hourly: Open-Meteo hourly forecast dict with 'time' and variable lists.
+        planned_start: Start of planned application window (UTC).
+        planned_end: End of planned application window (UTC).
 
-    # Humidity.
-    hum_check = _check_humidity(
-        avg_humidity, constraints.min_humidity_pct, constraints.max_humidity_pct,
+    Returns:
+        SprayEvaluation with per-constraint results and overall go/no-go.
+    """
+    times = hourly.get("time", [])
+
+    if not times:
+        return _no_forecast_evaluation()
+
+    window = ForecastWindow(
+        hourly=hourly,
+        start_idx=_find_hour_index(times, planned_start),
+        end_idx=_find_hour_index(times, planned_end),
     )
-    if hum_check:
-        checks.append(hum_check)
+    return _evaluate_window(constraints, window)
+
 
-    # Rain-free.
-    checks.append(_check_rain_free(precips, start_idx, constraints.rain_free_hours))
+def evaluate_many(
+    requests: list[tuple[ProductConstraints, datetime, datetime]],
+    hourly: dict[str, list],
+) -> list[SprayEvaluation]:
+    """Evaluate several (constraints, planned_start, planned_end) requests.
+
+    Equivalent to calling evaluate_conditions for each request, but hour
+    lookups and forecast reductions are computed once and shared between
+    requests covering the same hours.
+    """
+    times = hourly.get("time", [])
+    if not times:
+        return [_no_forecast_evaluation() for _ in requests]
+
+    hour_index: dict[datetime, int] = {}
+    windows: dict[tuple[int, int], ForecastWindow] = {}
+    results: list[SprayEvaluation] = []
+    for constraints, planned_start, planned_end in requests:
+        for dt in (planned_start, planned_end):
+            if dt not in hour_index:
+                hour_index[dt] = _find_hour_index(times, dt)
+        span = (hour_index[planned_start], hour_index[planned_end])
+        window = windows.get(span)
+        if window is None:
+            window = windows[span] = ForecastWindow(hourly, *span)
+        results.append(_evaluate_window(constraints, window))
+    return results
+
+
+def _no_forecast_evaluation() -> SprayEvaluation:
+    return SprayEvaluation(
+        go=False,
+        constraints=[],
+        overall_detail="No forecast data available for evaluation.",
+        confidence="LOW",
+    )
+
+
+def _evaluate_window(
+    constraints: ProductConstraints, window: ForecastWindow,
+) -> SprayEvaluation:
+    """Run a product's window checks and summarise them into go/no-go."""
+    checks = [check(constraints, window) for check in constraints.active_checks()]
 
     all_passed = all(c.passed for c in checks)
     failed = [c for c in checks if not c.passed]
@@ -460,15 +724,13 @@ def evaluate_current(
 
     wind = current_obs.get("wind_speed_mph")
     gust = current_obs.get("wind_gust_mph")
-    checks.append(_check_wind(wind, gust, constraints.max_wind_mph))
+    checks.append(_check_wind(wind, gust, constraints))
 
     temp = current_obs.get("outside_temp_f")
-    checks.append(_check_temperature(temp, constraints.min_temp_f, constraints.max_temp_f))
+    checks.append(_check_temperature(temp, constraints))
 
     hum = current_obs.get("outside_humidity_pct")
-    hum_check = _check_humidity(
-        hum, constraints.min_humidity_pct, constraints.max_humidity_pct,
-    )
+    hum_check = _check_humidity(hum, constraints)
     if hum_check:
         checks.append(hum_check)
 
@@ -506,6 +768,81 @@ def evaluate_current(
     )
 
 
+@lru_cache(maxsize=32)
+def _tz(name: str) -> Optional[ZoneInfo]:
+    """Resolve a station timezone name, or None if it is not valid."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def _scan_ok_hours(
+    constraints: ProductConstraints,
+    hourly: dict[str, list],
+    limit: int,
+) -> list[bool]:
+    """Per-hour pass/fail of every constraint over the first limit hours.
+
+    Thresholds and series lengths are bound to locals up front so the
+    loop body is only comparisons; missing humidity bounds become
+    infinities rather than per-hour None checks.
+    """
+    temps = hourly.get("temperature_2m", [])
+    humidities = hourly.get("relative_humidity_2m", [])
+    precips = hourly.get("precipitation", [])
+    winds = hourly.get("wind_speed_10m", [])
+    gusts = hourly.get("wind_gusts_10m", [])
+    n_temps, n_hums, n_precip = len(temps), len(humidities), len(precips)
+    n_winds, n_gusts = len(winds), len(gusts)
+
+    max_wind = constraints.max_wind_mph
+    min_temp = constraints.min_temp_f
+    max_temp = constraints.max_temp_f
+    check_humidity = constraints.has_humidity_limits
+    min_hum = constraints.min_humidity_pct
+    max_hum = constraints.max_humidity_pct
+    if min_hum is None:
+        min_hum = -math.inf
+    if max_hum is None:
+        max_hum = math.inf
+    rf_hours = constraints.rf_hours_int
+
+    # Hours from each index until the next rainy hour, filled by one reverse
+    # sweep, so the rain-free check is a single comparison per hour.
+    next_rain: list[float] = [math.inf] * n_precip
+    hours_to_rain = math.inf
+    for j in range(n_precip - 1, -1, -1):
+        p = precips[j]
+        hours_to_rain = 0 if p is not None and p > 0 else hours_to_rain + 1
+        next_rain[j] = hours_to_rain
+
+    ok_hours: list[bool] = []
+    for i in range(limit):
+        w = gusts[i] if i < n_gusts else None
+        if w is None and i < n_winds:
+            w = winds[i]
+        if w is not None and w > max_wind:
+            ok_hours.append(False)
+            continue
+
+        t = temps[i] if i < n_temps else None
+        if t is not None and not min_temp <= t <= max_temp:
+            ok_hours.append(False)
+            continue
+
+        if check_humidity and i < n_hums:
+            h = humidities[i]
+            if h is not None and not min_hum <= h <= max_hum:
+                ok_hours.append(False)
+                continue
+
+        # Rain-free: no precip for rain_free_hours starting at this hour.
+        ok_hours.append(i >= n_precip or next_rain[i] >= rf_hours)
+
+    return ok_hours
+
+
 def find_optimal_window(
     constraints: ProductConstraints,
     hourly: dict[str, list],
@@ -517,95 +854,44 @@ def find_optimal_window(
     Returns {"start": iso_str, "end": iso_str, "duration_hours": N} or None.
     """
     times = hourly.get("time", [])
-    temps = hourly.get("temperature_2m", [])
-    humidities = hourly.get("relative_humidity_2m", [])
-    precips = hourly.get("precipitation", [])
-    winds = hourly.get("wind_speed_10m", [])
-    gusts = hourly.get("wind_gusts_10m", [])
-
     if not times:
         return None
 
     # Determine how many future hours to scan.
     limit = min(search_hours, len(times))
+    ok_hours = _scan_ok_hours(constraints, hourly, limit)
 
-    # For each hour, check if all instantaneous constraints pass.
-    ok_hours: list[bool] = []
-    for i in range(limit):
-        wind_ok = True
-        w = gusts[i] if i < len(gusts) and gusts[i] is not None else (
-            winds[i] if i < len(winds) else None
-        )
-        if w is not None:
-            wind_ok = w <= constraints.max_wind_mph
-
-        temp_ok = True
-        t = temps[i] if i < len(temps) else None
-        if t is not None:
-            temp_ok = constraints.min_temp_f <= t <= constraints.max_temp_f
-
-        hum_ok = True
-        h = humidities[i] if i < len(humidities) else None
-        if h is not None:
-            if constraints.min_humidity_pct is not None:
-                hum_ok = hum_ok and h >= constraints.min_humidity_pct
-            if constraints.max_humidity_pct is not None:
-                hum_ok = hum_ok and h <= constraints.max_humidity_pct
-
-        # Rain-free: check no precip for rain_free_hours starting at this hour.
-        rain_ok = True
-        rf_hours = int(constraints.rain_free_hours + 0.99)
-        for j in range(i, min(i + rf_hours, len(precips))):
-            p = precips[j] if j < len(precips) else None
-            if p is not None and p > 0:
-                rain_ok = False
-                break
-
-        ok_hours.append(wind_ok and temp_ok and hum_ok and rain_ok)
-
-    # Find the longest run of consecutive OK hours.
-    best_start = -1
+    # Find the longest (earliest on ties) run of consecutive OK hours.
+    best_start = 0
     best_len = 0
-    run_start = -1
-    run_len = 0
-    for i, ok in enumerate(ok_hours):
-        if ok:
-            if run_start < 0:
-                run_start = i
-                run_len = 1
-            else:
-                run_len += 1
-            if run_len > best_len:
-                best_start = run_start
-                best_len = run_len
-        else:
-            run_start = -1
-            run_len = 0
-
-    if best_len < 1 or best_start < 0:
+    run_start = 0
+    for ok, run in groupby(ok_hours):
+        run_len = sum(1 for _ in run)
+        if ok and run_len > best_len:
+            best_start, best_len = run_start, run_len
+        run_start += run_len
+
+    if best_len < 1:
         return None
 
     # Resolve timezone for display.
-    tz: ZoneInfo | None = None
-    if station_tz:
-        try:
-            tz = ZoneInfo(station_tz)
-        except (KeyError, Exception):
-            pass
+    tz = _tz(station_tz) if station_tz else None
 
     start_iso = times[best_start]
     end_idx = min(best_start + best_len - 1, len(times) - 1)
     end_iso = times[end_idx]
 
-    # Convert to local time if timezone available.
+    # Convert to local time if timezone available.  Open-Meteo times are
+    # naive UTC, so parse them with an explicit offset.
     if tz:
         try:
-            s = datetime.fromisoformat(start_iso).replace(tzinfo=timezone.utc).astimezone(tz)
-            e = datetime.fromisoformat(end_iso).replace(tzinfo=timezone.utc).astimezone(tz)
+            s = datetime.fromisoformat(start_iso + "+00:00").astimezone(tz)
+            e = datetime.fromisoformat(end_iso + "+00:00").astimezone(tz)
+        except ValueError:
+            pass
+        else:
             start_iso = s.isoformat()
             end_iso = e.isoformat()
-        except (ValueError, Exception):
-            pass
 
     return {
         "start": start_iso,
@@ -3,14 +3,18 @@
 Periodically uploads sensor readings to WU using their PWS Upload Protocol.
 Called on every poller broadcast; internally rate-limits to the configured
 upload interval.  Configuration is read from the station_config database
-table so changes made through the Settings UI take effect immediately.
+table and cached for CONFIG_TTL seconds; the Settings UI invalidates the
+cache over IPC so changes still take effect immediately.
 
 Reference: https://support.weather.com/s/article/PWS-Upload-Protocol
 """
 
 import logging
 import time
-from typing import Any, Optional
+from functools import reduce
+from operator import getitem
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
 
 import httpx
 
@@ -23,6 +27,7 @@ WU_URL = "https://weatherstation.wunderground.com/weatherstation/updateweatherst
 REQUEST_TIMEOUT = 10.0
 MAX_CONSECUTIVE_ERRORS = 5
 MAX_BACKOFF_INTERVAL = 300  # 5 minutes
+CONFIG_TTL = 30.0  # seconds between config re-reads from the database
 
 # Map of WU parameter name -> nested dict path in the poller broadcast data.
 FIELD_MAP: dict[str, tuple[str, ...]] = {
@@ -41,16 +46,20 @@ FIELD_MAP: dict[str, tuple[str, ...]] = {
 }
 
 
-def _extract(data: dict, path: tuple[str, ...]) -> Optional[Any]:
-    """Walk a nested dict by key path, returning None if any key is missing."""
-    obj: Any = data
-    for key in path:
-        if not isinstance(obj, dict):
-            return None
-        obj = obj.get(key)
-        if obj is None:
+def _compile_path(path: tuple[str, ...]) -> Callable[[dict], Optional[Any]]:
+    """Build a getter for a nested key path, returning None if any key is missing."""
+    def get(data: dict) -> Optional[Any]:
+        try:
+            return reduce(getitem, path, data)
+        except (KeyError, TypeError):
             return None
-    return obj
+    return get
+
+
+# FIELD_MAP paths compiled once at import; used by _measurements per upload.
+_GETTERS: dict[str, Callable[[dict], Optional[Any]]] = {
+    wu_param: _compile_path(path) for wu_param, path in FIELD_MAP.items()
+}
 
 
 class WundergroundUploader:
@@ -64,6 +73,14 @@ class WundergroundUploader:
         self._last_upload: float = 0.0
         self._consecutive_errors: int = 0
         self._effective_interval: int = 60
+        self._client: Optional[httpx.AsyncClient] = None
+        self._config_loaded_at: Optional[float] = None
+        self._base_query: str = ""
+
+    @property
+    def enabled(self) -> bool:
+        """Last-loaded WU enabled flag."""
+        return self._enabled
 
     def reload_config(self) -> None:
         """Read WU config from the station_config database table."""
@@ -81,21 +98,41 @@ class WundergroundUploader:
             self._enabled = cfg.get("wu_enabled", "false").lower() == "true"
             self._station_id = cfg.get("wu_station_id", "")
             self._station_key = cfg.get("wu_station_key", "")
+            # Fixed part of the upload query, encoded once per config load.
+            self._base_query = urlencode({
+                "ID": self._station_id,
+                "PASSWORD": self._station_key,
+                "dateutc": "now",
+                "action": "updateraw",
+                "softwaretype": "kanfei",
+            })
             try:
                 self._upload_interval = int(cfg.get("wu_upload_interval", "60"))
             except (ValueError, TypeError):
                 self._upload_interval = 60
             # Reset effective interval when config is reloaded
             self._effective_interval = self._upload_interval
+            self._config_loaded_at = time.monotonic()
         except Exception as exc:
             logger.error("Failed to load WU config: %s", exc)
         finally:
             db.close()
 
+    def refresh_config(self) -> None:
+        """Reload config if the cached copy is older than CONFIG_TTL."""
+        if (
+            self._config_loaded_at is None
+            or time.monotonic() - self._config_loaded_at > CONFIG_TTL
+        ):
+            self.reload_config()
+
+    def invalidate_config(self) -> None:
+        """Force the next refresh_config() to re-read the database."""
+        self._config_loaded_at = None
+
     async def maybe_upload(self, data: dict) -> None:
         """Called on every sensor broadcast. Upload if enabled and interval elapsed."""
-        # Re-read config each cycle so Settings changes take effect immediately
-        self.reload_config()
+        self.refresh_config()
 
         if not self._enabled or not self._station_id or not self._station_key:
             return
@@ -107,13 +144,19 @@ class WundergroundUploader:
         await self._do_upload(data)
 
     async def _do_upload(self, data: dict) -> None:
-        """Build WU query params and send HTTP GET."""
-        params = self._build_params(self._station_id, self._station_key, data)
+        """Build WU query string and send HTTP GET."""
+        measurements = self._measurements(data)
+        if not measurements:
+            # Sensors disconnected: nothing worth a request.  Still count it
+            # as an attempt so the interval check doesn't retry every poll.
+            self._last_upload = time.monotonic()
+            logger.debug("WU upload skipped: no measurements")
+            return
+        url = f"{WU_URL}?{self._base_query}&{urlencode(measurements)}"
 
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                resp = await client.get(WU_URL, params=params)
-                body = resp.text.strip()
+            resp = await self._get_client().get(url)
+            body = resp.text.strip()
 
             if body.lower().startswith("success"):
                 self._last_upload = time.monotonic()
@@ -134,6 +177,21 @@ class WundergroundUploader:
             logger.error("WU upload unexpected error: %s", exc)
             self._apply_backoff()
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the keep-alive client reused across uploads."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the upload client (called on daemon shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _apply_backoff(self) -> None:
         """Double the effective interval after repeated failures."""
         if self._consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
@@ -147,19 +205,11 @@ class WundergroundUploader:
             )
 
     @staticmethod
-    def _build_params(station_id: str, station_key: str, data: dict) -> dict:
-        """Map sensor broadcast data to WU query parameters."""
-        params: dict[str, Any] = {
-            "ID": station_id,
-            "PASSWORD": station_key,
-            "dateutc": "now",
-            "action": "updateraw",
-            "softwaretype": "kanfei",
-        }
-
-        for wu_param, path in FIELD_MAP.items():
-            value = _extract(data, path)
+    def _measurements(data: dict) -> dict[str, Any]:
+        """Map sensor broadcast data to WU measurement parameters."""
+        params: dict[str, Any] = {}
+        for wu_param, get in _GETTERS.items():
+            value = get(data)
             if value is not None:
                 params[wu_param] = value
-
         return params
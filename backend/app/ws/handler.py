@@ -5,78 +5,256 @@ to all connected browser WebSocket clients.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any
+from collections import deque
+from contextlib import aclosing
+from typing import Any, Callable
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
-from ..config import settings
 from ..ipc.client import IPCClient
+from ..ipc.dependencies import get_ipc_client
+from ..ipc.protocol import decode_message, peek_type
 
 logger = logging.getLogger(__name__)
 
+# IPC messages buffered between the relay and the browser fan-out.
+RELAY_QUEUE_SIZE = 64
+# Frames buffered per browser before old frames are dropped.
+CLIENT_QUEUE_SIZE = 64
+
+# Keep-alive frames.  The browser client sends exactly PING_FRAME
+# (JSON.stringify({type: "ping"})), so it can be matched without parsing.
+PING_FRAME = '{"type":"ping"}'
+PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+# connection_status frames, keyed by the logger's connected flag.
+STATUS_FRAMES = {
+    connected: orjson.dumps({"type": "connection_status", "connected": connected}).decode()
+    for connected in (True, False)
+}
+
+
+class _ClientChannel:
+    """Bounded outbound queue for one browser, drained by its own writer task.
+
+    When the queue is full the oldest sensor_update frame is dropped —
+    a newer reading supersedes it.  Control frames are only dropped once
+    the queue holds nothing else, oldest first, so a stalled browser
+    never holds more than CLIENT_QUEUE_SIZE frames.
+    """
+
+    def __init__(self, websocket: WebSocket, on_error: Callable[[WebSocket], None]) -> None:
+        self.websocket = websocket
+        self._on_error = on_error
+        self._frames: deque[tuple[bool, dict[str, Any]]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._writer())
+
+    def push(self, frame: dict[str, Any], droppable: bool) -> None:
+        if len(self._frames) >= CLIENT_QUEUE_SIZE:
+            for i, (old_droppable, _) in enumerate(self._frames):
+                if old_droppable:
+                    del self._frames[i]
+                    break
+            else:
+                if droppable:
+                    return  # Queue is all control frames; skip this update
+                # Browser is hopelessly behind; drop its oldest control frame
+                self._frames.popleft()
+        self._frames.append((droppable, frame))
+        self._wakeup.set()
+
+    def close(self) -> None:
+        self._task.cancel()
+
+    async def _writer(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._frames:
+                _, frame = self._frames.popleft()
+                try:
+                    await self.websocket.send(frame)
+                except Exception:
+                    self._on_error(self.websocket)
+                    return
+
 
 class ConnectionManager:
-    """Manages browser WebSocket connections and the IPC relay to the logger."""
+    """Manages browser WebSocket connections and the IPC relay to the logger.
+
+    The relay and fan-out tasks are started once with the app and live
+    for its lifetime.  The relay holds an IPC subscription only while
+    browser clients are connected (so the logger can skip building
+    payloads nobody reads) and hands messages to the fan-out task
+    through a bounded queue, so slow browser sends never stall IPC reads.
+    Each browser then gets its own bounded channel and writer task.
+    """
 
     def __init__(self) -> None:
-        self.active_connections: list[WebSocket] = []
+        # Connected browsers, each with its own outbound channel.
+        self.active_connections: dict[WebSocket, _ClientChannel] = {}
         self._relay_task: asyncio.Task | None = None
+        self._fanout_task: asyncio.Task | None = None
+        # (message type, JSON text) pairs awaiting fan-out.
+        self._queue: asyncio.Queue[tuple[str | None, str]] = asyncio.Queue(maxsize=RELAY_QUEUE_SIZE)
+        self._clients_present = asyncio.Event()
+        # Logger connection status, kept current by the relay so a new
+        # browser gets it without an IPC round trip of its own.
+        self._logger_connected = False
+        # Dedicated command connection for status checks, so they never
+        # queue behind long API commands on the shared client's lock.
+        self._status_client: IPCClient | None = None
+
+    @property
+    def status_frame(self) -> str:
+        """The cached connection_status frame for a newly connected browser."""
+        return STATUS_FRAMES[self._logger_connected]
+
+    def start(self) -> None:
+        """Start the relay and fan-out tasks (called from the app lifespan)."""
+        if self._relay_task is None or self._relay_task.done():
+            self._relay_task = asyncio.create_task(self._relay_loop())
+        if self._fanout_task is None or self._fanout_task.done():
+            self._fanout_task = asyncio.create_task(self._fanout_loop())
+
+    async def stop(self) -> None:
+        """Cancel the relay and fan-out tasks and close the status connection."""
+        for task in (self._relay_task, self._fanout_task):
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *(t for t in (self._relay_task, self._fanout_task) if t is not None),
+            return_exceptions=True,
+        )
+        self._relay_task = None
+        self._fanout_task = None
+        if self._status_client is not None:
+            await self._status_client.close()
+            self._status_client = None
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections[websocket] = _ClientChannel(websocket, self.disconnect)
         logger.info("WebSocket client connected. Total: %d", len(self.active_connections))
-
-        # Start the IPC relay if this is the first browser client
-        if len(self.active_connections) == 1:
-            self._start_relay()
+        self._clients_present.set()
 
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        channel = self.active_connections.pop(websocket, None)
+        if channel is None:
+            return  # Already removed after a failed send
+        channel.close()
         logger.info("WebSocket client disconnected. Total: %d", len(self.active_connections))
-
-        # Stop relay when no more browser clients
-        if not self.active_connections and self._relay_task:
-            self._relay_task.cancel()
-            self._relay_task = None
-
-    def _start_relay(self) -> None:
-        if self._relay_task and not self._relay_task.done():
-            return
-        self._relay_task = asyncio.create_task(self._relay_loop())
+        if not self.active_connections:
+            self._clients_present.clear()
 
     async def _relay_loop(self) -> None:
-        """Subscribe to the logger daemon IPC and relay messages to browsers."""
-        while self.active_connections:
+        """Subscribe to the logger daemon IPC while browsers are connected."""
+        while True:
+            await self._clients_present.wait()
             try:
-                client = IPCClient(settings.ipc_port)
-                async for msg in client.subscribe():
-                    if not self.active_connections:
-                        break
-                    await self.broadcast(msg)
-            except asyncio.CancelledError:
-                break
+                # Status may have changed while nobody was subscribed
+                await self._refresh_status()
+                client = get_ipc_client()
+                # Forward the logger's JSON as-is; only the type is peeked
+                # (for status tracking and coalescing), never a full parse.
+                async with aclosing(client.subscribe_raw()) as stream:
+                    async for line in stream:
+                        if not self.active_connections:
+                            break
+                        msg_type = peek_type(line)
+                        if msg_type == "connection_status":
+                            msg = decode_message(line)
+                            self._logger_connected = bool(msg.get("connected"))
+                        self._enqueue(msg_type, line.decode())
             except (ConnectionRefusedError, OSError):
                 # Logger not running — wait and retry
+                self._set_connected(False)
                 await asyncio.sleep(2.0)
             except Exception as exc:
                 logger.error("IPC relay error: %s", exc)
                 await asyncio.sleep(2.0)
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Send a message to all connected WebSocket clients."""
-        disconnected: list[WebSocket] = []
-        for conn in self.active_connections:
+    async def _refresh_status(self) -> None:
+        """Fetch the logger's connection status with a single IPC call."""
+        if self._status_client is None:
+            self._status_client = IPCClient(get_ipc_client().port)
+        try:
+            # The status client keeps its own connection open between calls
+            result = await self._status_client.send_command({"cmd": "status"}, timeout=3.0)
+            connected = bool(
+                result.get("ok", False)
+                and result.get("data", {}).get("connected", False)
+            )
+        except (ConnectionRefusedError, OSError, asyncio.TimeoutError):
+            connected = False
+        self._set_connected(connected)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Update the cached status, notifying browsers if it changed."""
+        if self._logger_connected == connected:
+            return
+        self._logger_connected = connected
+        if self.active_connections:
+            self._enqueue("connection_status", self.status_frame)
+
+    def _enqueue(self, msg_type: str | None, text: str) -> None:
+        """Queue a message for fan-out, dropping the oldest if full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait((msg_type, text))
+
+    async def _fanout_loop(self) -> None:
+        """Broadcast queued IPC messages to the connected browsers."""
+        while True:
+            first = await self._queue.get()
+            for msg_type, text in self._drain_latest(first):
+                try:
+                    self.broadcast_text(msg_type, text)
+                except Exception as exc:
+                    logger.error("WebSocket fan-out error: %s", exc)
+
+    def _drain_latest(
+        self, first: tuple[str | None, str],
+    ) -> list[tuple[str | None, str]]:
+        """Drain the queue, keeping only the newest sensor_update.
+
+        A burst of sensor updates queued within one tick then costs one
+        frame per client instead of one per update.  Every other message
+        (alerts in particular, each carrying a distinct alert) is passed
+        through in arrival order.
+        """
+        items = [first]
+        while True:
             try:
-                await conn.send_json(message)
-            except Exception:
-                disconnected.append(conn)
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+                items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        newest_update = max(
+            (i for i, (msg_type, _) in enumerate(items) if msg_type == "sensor_update"),
+            default=None,
+        )
+        return [
+            item for i, item in enumerate(items)
+            if item[0] != "sensor_update" or i == newest_update
+        ]
+
+    async def broadcast(self, message: dict[str, Any]) -> None:
+        """Queue a message for all connected WebSocket clients."""
+        self.broadcast_text(message.get("type"), orjson.dumps(message).decode())
+
+    def broadcast_text(self, msg_type: str | None, text: str) -> None:
+        """Queue already-serialised JSON for all connected WebSocket clients."""
+        # Build the ASGI send message once for all clients.  Text frames,
+        # as the browser client parses event.data as a string.  Wire
+        # compression (permessage-deflate) is negotiated by uvicorn per
+        # connection; ASGI has no way to hand it a pre-compressed frame,
+        # and context takeover makes each client's deflate stream unique.
+        frame = {"type": "websocket.send", "text": text}
+        droppable = msg_type == "sensor_update"
+        for channel in list(self.active_connections.values()):
+            channel.push(frame, droppable)
 
 
 # Global connection manager
@@ -87,30 +265,19 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     """Handle WebSocket connections for live data streaming."""
     await ws_manager.connect(websocket)
     try:
-        # Send initial connection status from logger
-        try:
-            client = IPCClient(settings.ipc_port)
-            result = await client.send_command({"cmd": "status"}, timeout=3.0)
-            connected = (
-                result.get("ok", False)
-                and result.get("data", {}).get("connected", False)
-            )
-            await client.close()
-        except (ConnectionRefusedError, OSError, asyncio.TimeoutError):
-            connected = False
-
-        await websocket.send_json({
-            "type": "connection_status",
-            "connected": connected,
-        })
+        # Send the cached connection status kept current by the relay
+        await websocket.send_text(ws_manager.status_frame)
 
         while True:
             data = await websocket.receive_text()
+            if data == PING_FRAME:
+                await websocket.send_text(PONG_FRAME)
+                continue
             try:
-                msg = json.loads(data)
+                msg = orjson.loads(data)
                 if msg.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
-            except json.JSONDecodeError:
+                    await websocket.send_text(PONG_FRAME)
+            except orjson.JSONDecodeError:
                 pass
     except (WebSocketDisconnect, ConnectionResetError, OSError):
         # OSError covers Windows semaphore timeout on client disconnect
@@ -10,15 +10,17 @@ Stop:   Ctrl-C or SIGTERM
 """
 
 import asyncio
-import json
 import logging
 import os
 import signal
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 # Ensure the backend package is importable when running from the backend/ dir
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -76,7 +78,7 @@ class LoggerDaemon:
 
         # Wait for shutdown signal
         stop_event = asyncio.Event()
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         if sys.platform != "win32":
             for sig in (signal.SIGTERM, signal.SIGINT):
                 loop.add_signal_handler(sig, stop_event.set)
@@ -91,9 +93,17 @@ class LoggerDaemon:
 
     async def shutdown(self) -> None:
         logger.info("Shutting down logger daemon...")
-        await self._teardown_driver()
+        # Force the exit if teardown wedges (e.g. a serial read that never
+        # returns); cancelled below once shutdown completes normally.
+        watchdog = asyncio.get_running_loop().call_later(10.0, os._exit, 0)
+        try:
+            await asyncio.wait_for(self._teardown_driver(), timeout=8.0)
+        except asyncio.TimeoutError:
+            logger.warning("Driver teardown timed out")
         if self.ipc_server:
             await self.ipc_server.stop()
+        await self.wu_uploader.aclose()
+        watchdog.cancel()
         logger.info("Logger daemon stopped")
         # Exit directly — asyncio.run() cleanup hangs on executor threads
         logging.shutdown()
@@ -137,13 +147,23 @@ class LoggerDaemon:
                 await self.wu_uploader.maybe_upload(msg["data"])
                 await self.cwop_uploader.maybe_upload(msg["data"])
 
-        self.poller.set_broadcast_callback(_broadcast_and_upload)
+        def _has_consumers() -> bool:
+            if self.ipc_server.has_subscribers():
+                return True
+            # Uploaders consume sensor_update too.  Refresh their config here
+            # so enabling one in Settings still takes effect while skipped.
+            self.wu_uploader.refresh_config()
+            self.cwop_uploader.refresh_config()
+            return self.wu_uploader.enabled or self.cwop_uploader.enabled
+
+        self.poller.set_broadcast_callback(_broadcast_and_upload, _has_consumers)
 
         # Restore rain state from a previous run
         self._restore_rain_state()
 
         self.poller_task = asyncio.create_task(self.poller.run())
         logger.info("Poller started (%ds interval)", settings.poll_interval_sec)
+        await self._broadcast_connection_status()
 
     async def _teardown_driver(self) -> None:
         if self.poller:
@@ -160,9 +180,20 @@ class LoggerDaemon:
                 self.driver.close()
             except Exception:
                 pass
+        was_connected = self.driver is not None
         self.driver = None
         self.poller = None
         self.poller_task = None
+        if was_connected:
+            await self._broadcast_connection_status()
+
+    async def _broadcast_connection_status(self) -> None:
+        """Tell subscribers (the web app) that the station link changed."""
+        if self.ipc_server:
+            connected = self.driver.connected if self.driver else False
+            await self.ipc_server.broadcast_to_subscribers(
+                {"type": "connection_status", "connected": connected}
+            )
 
     async def _bg_archive_sync(self) -> None:
         try:
@@ -176,16 +207,22 @@ class LoggerDaemon:
     def _save_rain_state(self) -> None:
         if self.poller is None:
             return
+        # The poller tracks tips on the monotonic clock, which doesn't survive
+        # a restart — persist the equivalent wall-clock time instead.
+        tip_mono = self.poller._last_rain_tip_mono
+        tip_time = (
+            datetime.fromtimestamp(
+                time.time() - (time.monotonic() - tip_mono), tz=timezone.utc,
+            )
+            if tip_mono is not None else None
+        )
         state = {
             "last_rain_total": self.poller._last_rain_total,
-            "last_rain_tip_time": (
-                self.poller._last_rain_tip_time.isoformat()
-                if self.poller._last_rain_tip_time else None
-            ),
+            "last_rain_tip_time": tip_time,  # orjson writes RFC 3339
             "rain_rate_in_per_hr": self.poller._rain_rate_in_per_hr,
         }
         try:
-            self.state_file.write_text(json.dumps(state))
+            self.state_file.write_bytes(orjson.dumps(state))
             logger.info("Rain state saved to %s", self.state_file)
         except Exception as exc:
             logger.warning("Failed to save rain state: %s", exc)
@@ -194,11 +231,12 @@ class LoggerDaemon:
         if self.poller is None or not self.state_file.exists():
             return
         try:
-            state = json.loads(self.state_file.read_text())
+            state = orjson.loads(self.state_file.read_bytes())
             self.poller._last_rain_total = state.get("last_rain_total")
             tip = state.get("last_rain_tip_time")
             if tip:
-                self.poller._last_rain_tip_time = datetime.fromisoformat(tip)
+                age = time.time() - datetime.fromisoformat(tip).timestamp()
+                self.poller._last_rain_tip_mono = time.monotonic() - age
             self.poller._rain_rate_in_per_hr = state.get("rain_rate_in_per_hr", 0.0)
             logger.info("Restored rain state from %s", self.state_file)
         except Exception as exc:
@@ -241,6 +279,7 @@ class LoggerDaemon:
         h(ipc.CMD_CLEAR_RAIN_DAILY, self._h_clear_rain_daily)
         h(ipc.CMD_CLEAR_RAIN_YEARLY, self._h_clear_rain_yearly)
         h(ipc.CMD_FORCE_ARCHIVE, self._h_force_archive)
+        h(ipc.CMD_RELOAD_UPLOADERS, self._h_reload_uploaders)
 
     # ---- IPC handlers ----
 
@@ -295,28 +334,49 @@ class LoggerDaemon:
 
         ports = list_serial_ports()
         attempts: list[dict] = []
-        for port in ports:
+        # Probe ports concurrently (a port's baud rates stay sequential, as
+        # it can only be open once) and answer with the first station found.
+        limit = asyncio.Semaphore(8)
+        probes = [
+            asyncio.create_task(self._probe_port(port, limit, attempts))
+            for port in ports
+        ]
+        for next_done in asyncio.as_completed(probes):
+            result = await next_done
+            if result is not None:
+                # Probes still running finish in the background and close
+                # their own ports; cancelling them would close a port while
+                # its executor thread is still reading it.
+                return {**result, "attempts": list(attempts)}
+
+        return {"found": False, "attempts": attempts}
+
+    @staticmethod
+    async def _probe_port(
+        port: str, limit: asyncio.Semaphore, attempts: list[dict],
+    ) -> Optional[dict[str, Any]]:
+        """Try each baud rate on one port; return the station found, if any."""
+        async with limit:
             for baud in (2400, 1200):
                 try:
                     tmp = LinkDriver(port=port, baud_rate=baud, timeout=3.0)
                     tmp.open()
                     try:
                         station = await tmp.async_detect_station_type()
-                        attempts.append({"port": port, "baud": baud, "result": "found"})
-                        return {
-                            "found": True,
-                            "port": port,
-                            "baud_rate": baud,
-                            "station_type": STATION_NAMES.get(station, "Unknown"),
-                            "station_code": station.value,
-                            "attempts": attempts,
-                        }
                     finally:
                         tmp.close()
                 except Exception as exc:
                     attempts.append({"port": port, "baud": baud, "error": str(exc)})
-
-        return {"found": False, "attempts": attempts}
+                    continue
+                attempts.append({"port": port, "baud": baud, "result": "found"})
+                return {
+                    "found": True,
+                    "port": port,
+                    "baud_rate": baud,
+                    "station_type": STATION_NAMES.get(station, "Unknown"),
+                    "station_code": station.value,
+                }
+        return None
 
     async def _h_connect(self, msg: dict) -> dict[str, Any]:
         await self._teardown_driver()
@@ -407,6 +467,8 @@ class LoggerDaemon:
         if not self.driver or not self.driver.connected:
             raise RuntimeError("Not connected")
         ok = await self.driver.async_clear_rain_yearly()
+        if ok and self.poller:
+            self.poller.invalidate_rain_yearly()
         return {"success": ok}
 
     async def _h_force_archive(self, _msg: dict) -> dict[str, Any]:
@@ -415,6 +477,11 @@ class LoggerDaemon:
         ok = await self.driver.async_force_archive()
         return {"success": ok}
 
+    async def _h_reload_uploaders(self, _msg: dict) -> dict[str, Any]:
+        self.wu_uploader.invalidate_config()
+        self.cwop_uploader.invalidate_config()
+        return {"success": True}
+
 
 # --------------- Entry point ---------------
 
@@ -425,10 +492,31 @@ def main() -> None:
     )
     daemon = LoggerDaemon()
     try:
-        asyncio.run(daemon.run())
+        _run_event_loop(daemon.run())
     except KeyboardInterrupt:
         pass
 
 
+def _run_event_loop(coro) -> None:
+    """Run coro on uvloop when available, else the stock asyncio loop.
+
+    uvloop ships with uvicorn[standard] on POSIX; it is not available on
+    Windows, where the default loop is used.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            if hasattr(uvloop, "run"):
+                uvloop.run(coro)
+            else:  # uvloop < 0.18
+                uvloop.install()
+                asyncio.run(coro)
+            return
+    asyncio.run(coro)
+
+
 if __name__ == "__main__":
     main()
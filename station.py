@@ -14,13 +14,17 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import os
 import shutil
 import signal
+import stat
 import subprocess
 import sys
 import textwrap
 import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -42,6 +46,25 @@ else:
     VENV_PIP = VENV_DIR / "bin" / "pip"
     VENV_UVICORN = VENV_DIR / "bin" / "uvicorn"
 
+# Inputs of the production frontend build, and the stamp recording the
+# hash of the inputs dist/ was built from
+FRONTEND_BUILD_FILES = (
+    "package.json", "package-lock.json", "index.html", "vite.config.ts",
+    "tsconfig.json", "tsconfig.app.json", "tsconfig.node.json",
+)
+FRONTEND_BUILD_DIRS = ("src", "public")
+BUILD_HASH_FILE = FRONTEND_DIR / "dist" / ".build-hash"
+
+# Directory names `clean` removes wherever they occur, and those it never
+# searches inside
+CACHE_DIRS = {"__pycache__", ".pytest_cache"}
+CLEAN_SKIP_DIRS = {".git", "node_modules", ".venv", "dist"}
+
+# uvloop and httptools come with uvicorn[standard] except on Windows.  Ask
+# for them explicitly so a broken install fails loudly instead of quietly
+# falling back to the slower pure-Python loop and parser.
+UVICORN_LOOP_ARGS = [] if IS_WINDOWS else ["--loop", "uvloop", "--http", "httptools"]
+
 MIN_PYTHON = (3, 10)
 MIN_NODE = 18
 
@@ -78,17 +101,26 @@ def run_cmd(
     env: dict | None = None,
     check: bool = True,
     quiet: bool = False,
+    shell: bool | None = None,
 ) -> subprocess.CompletedProcess:
-    """Run a subprocess, using shell=True on Windows for .cmd/.bat scripts."""
-    # On Windows, npm/npx are .cmd files and need shell=True
-    needs_shell = IS_WINDOWS and any(
-        c.endswith((".cmd", ".bat")) or c in ("npm", "npx", "node")
-        for c in cmd[:1]
-    )
+    """Run a subprocess.
+
+    Pass shell=IS_WINDOWS for npm/npx, which are .cmd scripts on Windows
+    and need a shell there.  If shell is left as None, it is inferred
+    the same way from the command name.
+    """
+    if shell is None:
+        shell = IS_WINDOWS and bool(cmd) and (
+            cmd[0] in ("npm", "npx", "node") or cmd[0].endswith((".cmd", ".bat"))
+        )
     kwargs: dict = {
         "cwd": str(cwd) if cwd else None,
         "check": check,
-        "shell": needs_shell,
+        "shell": shell,
+        # Lets CPython use posix_spawn() instead of fork+exec where it can.
+        # Safe because Python-created descriptors are non-inheritable
+        # (PEP 446), so children still only get stdin/stdout/stderr.
+        "close_fds": False,
     }
     if env:
         merged = {**os.environ, **env}
@@ -99,11 +131,39 @@ def run_cmd(
     return subprocess.run(cmd, **kwargs)
 
 
+def _clear_readonly(func, path, _exc) -> None:
+    """rmtree error handler: clear the read-only bit (Windows) and retry."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def remove_tree(path: Path) -> None:
+    """shutil.rmtree that also removes read-only files."""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_clear_readonly)
+    else:
+        shutil.rmtree(path, onerror=_clear_readonly)
+
+
+@functools.cache
 def find_npm() -> str | None:
     """Locate npm executable."""
     return shutil.which("npm")
 
 
+def find_uv() -> str | None:
+    """Locate a working uv executable (fast pip-compatible installer)."""
+    uv = shutil.which("uv")
+    if not uv:
+        return None
+    try:
+        subprocess.run([uv, "--version"], check=True, capture_output=True)
+        return uv
+    except Exception:
+        return None
+
+
+@functools.cache
 def get_node_version() -> int | None:
     """Return the major Node.js version, or None if not installed."""
     node = shutil.which("node")
@@ -117,6 +177,57 @@ def get_node_version() -> int | None:
         return None
 
 
+def wait_any(*procs: subprocess.Popen) -> None:
+    """Block until any of the given child processes exits."""
+    if not IS_WINDOWS:
+        # Sleep in the kernel until a child exits.  Signal handlers still
+        # run during the wait, and their terminate() calls end it.
+        by_pid = {p.pid: p for p in procs}
+        while True:
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                return  # Already reaped (e.g. by Popen.poll in a handler)
+            if pid in by_pid:
+                by_pid[pid].returncode = os.waitstatus_to_exitcode(status)
+                return
+    while all(p.poll() is None for p in procs):
+        try:
+            procs[0].wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+def frontend_inputs_hash() -> str:
+    """Hash everything the Vite build reads (config, lockfile, sources)."""
+    files = [FRONTEND_DIR / name for name in FRONTEND_BUILD_FILES]
+    for name in FRONTEND_BUILD_DIRS:
+        files.extend(sorted((FRONTEND_DIR / name).rglob("*")))
+    digest = hashlib.blake2b()
+    for path in files:
+        if path.is_file():
+            data = path.read_bytes()
+            rel = path.relative_to(FRONTEND_DIR).as_posix()
+            digest.update(f"{rel}\0{len(data)}\0".encode())
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def frontend_build_current() -> bool:
+    """True if dist/ was built by build_frontend() from the current inputs."""
+    try:
+        return BUILD_HASH_FILE.read_text().strip() == frontend_inputs_hash()
+    except OSError:
+        return False
+
+
+def build_frontend() -> None:
+    """Run the production Vite build and stamp dist/ with its input hash."""
+    digest = frontend_inputs_hash()
+    run_cmd(["npm", "run", "build"], cwd=FRONTEND_DIR, shell=IS_WINDOWS)
+    BUILD_HASH_FILE.write_text(digest)
+
+
 # ---------------------------------------------------------------------------
 # Prerequisites check
 # ---------------------------------------------------------------------------
@@ -167,47 +278,72 @@ def cmd_setup(_args: argparse.Namespace) -> int:
     if not check_prerequisites():
         return 1
 
+    uv = find_uv()
+
     # 1. Python virtual environment
     heading("Creating Python virtual environment")
     if VENV_PYTHON.exists():
         ok(f"venv already exists at {VENV_DIR}")
     else:
         step(f"Creating venv in {VENV_DIR}")
-        venv.create(str(VENV_DIR), with_pip=True)
+        # uv installs into the venv without pip, so skip the slow ensurepip
+        # bootstrap when it's available.  Symlink the interpreter on POSIX
+        # rather than copying it.
+        venv.create(str(VENV_DIR), with_pip=uv is None, symlinks=not IS_WINDOWS)
         ok("venv created")
 
     # 2. Python dependencies
     heading("Installing Python dependencies")
-    step("Upgrading pip")
-    run_cmd([str(VENV_PIP), "install", "--upgrade", "pip"])
-    step("Installing backend package with dev extras")
-    run_cmd([str(VENV_PIP), "install", "-e", f"{BACKEND_DIR}[dev]"])
+    if uv:
+        # uv installs into the venv directly and in parallel; no pip
+        # upgrade needed.
+        step("Installing backend package with dev extras (uv)")
+        run_cmd([uv, "pip", "install", "--python", str(VENV_PYTHON),
+                 "-e", f"{BACKEND_DIR}[dev]"])
+    else:
+        if not VENV_PIP.exists():
+            # venv was created by an earlier uv-based setup
+            step("Bootstrapping pip")
+            run_cmd([str(VENV_PYTHON), "-m", "ensurepip", "--upgrade"])
+        # One pip run upgrades pip and wheel and installs the backend.
+        # wheel lets older pips cache wheels built from sdists, so a
+        # re-setup doesn't rebuild them from source.
+        step("Upgrading pip and installing backend package with dev extras")
+        run_cmd([str(VENV_PIP), "install", "--upgrade", "pip", "wheel",
+                 "-e", f"{BACKEND_DIR}[dev]"])
     ok("Python dependencies installed")
 
     # 3. Node dependencies
     heading("Installing Node dependencies")
-    run_cmd(["npm", "install"], cwd=FRONTEND_DIR)
+    # With the committed lockfile, `npm ci` installs exactly what it pins
+    # without re-running the resolver (and never rewrites it)
+    npm_install = "ci" if (FRONTEND_DIR / "package-lock.json").exists() else "install"
+    run_cmd(["npm", npm_install], cwd=FRONTEND_DIR, shell=IS_WINDOWS)
     ok("Node dependencies installed")
 
     # 4. Build frontend
     heading("Building frontend for production")
-    run_cmd(["npm", "run", "build"], cwd=FRONTEND_DIR)
-    ok("Frontend built")
+    if frontend_build_current():
+        ok("Frontend already built from current sources")
+    else:
+        build_frontend()
+        ok("Frontend built")
 
     # 5. Create .env if missing
     env_file = ROOT / ".env"
     env_example = ROOT / ".env.example"
     if not env_file.exists() and env_example.exists():
         heading("Creating default .env file")
-        shutil.copy2(env_example, env_file)
+        # Copy as bytes so line endings are kept verbatim
+        data = env_example.read_bytes()
         if IS_WINDOWS:
             # Patch the default serial port for Windows
-            text = env_file.read_text()
-            text = text.replace(
-                "DAVIS_SERIAL_PORT=/dev/ttyUSB0",
-                "DAVIS_SERIAL_PORT=COM3",
+            data = data.replace(
+                b"DAVIS_SERIAL_PORT=/dev/ttyUSB0",
+                b"DAVIS_SERIAL_PORT=COM3",
             )
-            env_file.write_text(text)
+        env_file.write_bytes(data)
+        if IS_WINDOWS:
             step("Set default serial port to COM3 (edit .env to match your port)")
         ok(f"Created {env_file}")
         step("Edit .env to configure your serial port, location, etc.")
@@ -231,7 +367,12 @@ def cmd_run(_args: argparse.Namespace) -> int:
     frontend_dist = FRONTEND_DIR / "dist"
     if not frontend_dist.exists():
         warn("Frontend not built — building now...")
-        run_cmd(["npm", "run", "build"], cwd=FRONTEND_DIR)
+        build_frontend()
+    elif BUILD_HASH_FILE.exists() and not frontend_build_current():
+        # Only dists stamped by build_frontend() are checked; a dist
+        # deployed without sources or Node.js is used as-is.
+        warn("Frontend sources changed — rebuilding...")
+        build_frontend()
 
     heading("Starting Davis Weather Station")
     step("Server at http://localhost:8000")
@@ -241,7 +382,8 @@ def cmd_run(_args: argparse.Namespace) -> int:
     # subprocess.run() on Windows doesn't reliably forward the interrupt.
     proc = subprocess.Popen(
         [str(VENV_PYTHON), "-m", "uvicorn", "app.main:app",
-         "--host", "0.0.0.0", "--port", "8000", "--log-level", "info"],
+         "--host", "0.0.0.0", "--port", "8000", "--log-level", "info",
+         *UVICORN_LOOP_ARGS],
         cwd=str(BACKEND_DIR),
     )
 
@@ -279,7 +421,8 @@ def cmd_dev(_args: argparse.Namespace) -> int:
     # Start backend
     backend_proc = subprocess.Popen(
         [str(VENV_PYTHON), "-m", "uvicorn", "app.main:app",
-         "--host", "0.0.0.0", "--port", "8000", "--reload", "--log-level", "info"],
+         "--host", "0.0.0.0", "--port", "8000", "--reload", "--log-level", "info",
+         *UVICORN_LOOP_ARGS],
         cwd=str(BACKEND_DIR),
     )
 
@@ -300,17 +443,12 @@ def cmd_dev(_args: argparse.Namespace) -> int:
     if IS_WINDOWS:
         signal.signal(signal.SIGBREAK, cleanup)
 
-    # Wait for either to exit
+    # Wait for either to exit, then stop the other
     try:
-        while True:
-            be = backend_proc.poll()
-            fe = frontend_proc.poll()
-            if be is not None or fe is not None:
-                cleanup()
-                break
-            backend_proc.wait(timeout=1)
-    except (subprocess.TimeoutExpired, KeyboardInterrupt):
-        cleanup()
+        wait_any(backend_proc, frontend_proc)
+    except KeyboardInterrupt:
+        pass
+    cleanup()
 
     backend_proc.wait()
     frontend_proc.wait()
@@ -340,22 +478,56 @@ def cmd_clean(_args: argparse.Namespace) -> int:
         FRONTEND_DIR / "node_modules",
         VENV_DIR,
     ]
+    targets = [t for t in targets if t.exists()]
+
+    # Python caches, found in one walk that doesn't descend into VCS data,
+    # the trees removed above, or the caches themselves
+    for dirpath, dirnames, _ in os.walk(ROOT):
+        for d in [d for d in dirnames if d in CACHE_DIRS]:
+            targets.append(Path(dirpath) / d)
+        dirnames[:] = [
+            d for d in dirnames if d not in CLEAN_SKIP_DIRS and d not in CACHE_DIRS
+        ]
+
+    # Removal is dominated by per-file unlink calls (node_modules above
+    # all), so delete the trees concurrently.
     for target in targets:
-        if target.exists():
-            step(f"Removing {target.relative_to(ROOT)}")
-            shutil.rmtree(target)
-
-    # Python caches
-    for pattern in ("__pycache__", ".pytest_cache"):
-        for d in ROOT.rglob(pattern):
-            if d.is_dir():
-                step(f"Removing {d.relative_to(ROOT)}")
-                shutil.rmtree(d)
+        step(f"Removing {target.relative_to(ROOT)}")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(remove_tree, targets))
 
     ok("Clean complete")
     return 0
 
 
+def _dir_entries(path: Path) -> dict[str, os.DirEntry]:
+    """One scandir of path, by entry name (empty if it doesn't exist)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def snapshot_state() -> dict[str, object]:
+    """Collect installation state with one directory scan per location."""
+    root = _dir_entries(ROOT)
+    backend = _dir_entries(BACKEND_DIR)
+    frontend = _dir_entries(FRONTEND_DIR)
+    return {
+        "venv": VENV_PYTHON.exists(),
+        "node_modules": "node_modules" in frontend,
+        "frontend_dist": "dist" in frontend,
+        "env_file": ".env" in root,
+        "db_files": [
+            Path(entry.path)
+            for entries in (backend, root)
+            for entry in entries.values()
+            if entry.name.endswith(".db") and not entry.name.startswith(".")
+        ],
+    }
+
+
 def cmd_status(_args: argparse.Namespace) -> int:
     """Check installation state."""
     heading("Installation status")
@@ -371,37 +543,35 @@ def cmd_status(_args: argparse.Namespace) -> int:
     else:
         warn("Node.js not found")
 
+    state = snapshot_state()
+
     # venv
-    if VENV_PYTHON.exists():
+    if state["venv"]:
         ok(f"Python venv: {VENV_DIR}")
     else:
         warn("Python venv: not created")
 
     # Node modules
-    nm = FRONTEND_DIR / "node_modules"
-    if nm.exists():
+    if state["node_modules"]:
         ok("Node modules: installed")
     else:
         warn("Node modules: not installed")
 
     # Frontend build
-    dist = FRONTEND_DIR / "dist"
-    if dist.exists():
+    if state["frontend_dist"]:
         ok("Frontend build: ready")
     else:
         warn("Frontend build: not built")
 
     # .env
-    env_file = ROOT / ".env"
-    if env_file.exists():
-        ok(f".env file: {env_file}")
+    if state["env_file"]:
+        ok(f".env file: {ROOT / '.env'}")
     else:
         warn(".env file: not created (will use defaults)")
 
     # Database
-    db_files = list(BACKEND_DIR.glob("*.db")) + list(ROOT.glob("*.db"))
-    if db_files:
-        for db in db_files:
+    if state["db_files"]:
+        for db in state["db_files"]:
             ok(f"Database: {db}")
     else:
         step("Database: will be created on first run")
@@ -1,5 +1,7 @@
 """Tests for weather calculation services."""
 
+import pytest
+
 from app.services.calculations import (
     heat_index,
     dew_point,
@@ -60,13 +62,13 @@ class TestDewPoint:
     def test_zero_humidity_returns_none(self):
         assert dew_point(700, 0) is None
 
-    def test_always_less_than_or_equal_temp(self):
+    @pytest.mark.parametrize("temp", range(300, 1000, 100))
+    @pytest.mark.parametrize("rh", range(10, 101, 10))
+    def test_always_less_than_or_equal_temp(self, temp, rh):
         """Dew point should never exceed actual temperature."""
-        for temp in range(300, 1000, 100):
-            for rh in range(10, 101, 10):
-                result = dew_point(temp, rh)
-                if result is not None:
-                    assert result <= temp + 5  # Small tolerance for rounding
+        result = dew_point(temp, rh)
+        if result is not None:
+            assert result <= temp + 5  # Small tolerance for rounding
 
 
 class TestWindChill:
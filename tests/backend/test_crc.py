@@ -1,6 +1,12 @@
 """Tests for CRC-CCITT implementation."""
 
-from app.protocol.crc import CRC_TABLE, crc_accum, crc_calculate, crc_validate
+from app.protocol.crc import (
+    CRC_TABLE,
+    _generate_crc_table,
+    crc_accum,
+    crc_calculate,
+    crc_validate,
+)
 
 
 # Reference table from ccitt.h for cross-checking
@@ -19,6 +25,10 @@ class TestCRCTable:
     def test_table_length(self):
         assert len(CRC_TABLE) == 256
 
+    def test_literal_matches_generator(self):
+        """The shipped table literal is exactly the polynomial generator's output."""
+        assert list(CRC_TABLE) == _generate_crc_table()
+
     def test_first_entry_is_zero(self):
         assert CRC_TABLE[0] == 0
 
@@ -63,6 +73,14 @@ class TestCRCCalculation:
             crc = crc_accum(crc, byte)
         assert crc == crc_calculate(data)
 
+    def test_table_matches_calculate_for_all_bytes(self):
+        """The table-driven accumulator and crc_calculate agree on every byte value."""
+        data = bytes(range(256)) * 2
+        crc = 0
+        for byte in data:
+            crc = crc_accum(crc, byte)
+        assert crc == crc_calculate(data)
+
 
 class TestCRCValidation:
     def test_valid_data_with_crc(self):
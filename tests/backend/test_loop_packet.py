@@ -5,6 +5,12 @@ from app.protocol.crc import crc_calculate
 from app.protocol.constants import StationModel, SOH
 from app.protocol.loop_packet import parse_loop_packet
 
+# Basic LOOP data (after SOH): inside/outside temp, wind speed, wind
+# direction, barometer, inside/outside humidity, rain total, unused.
+_BASIC_LAYOUT = struct.Struct("<hhBHHBBHH")
+assert _BASIC_LAYOUT.size == 15
+_CRC = struct.Struct(">H")
+
 
 def _make_basic_packet(
     inside_temp: int = 720,
@@ -17,23 +23,19 @@ def _make_basic_packet(
     rain_total: int = 150,
 ) -> bytes:
     """Build a valid Monitor/Wizard/Perception LOOP packet with correct CRC."""
-    data = b""
-    data += struct.pack("<h", inside_temp)       # 2 bytes
-    data += struct.pack("<h", outside_temp)       # 2 bytes
-    data += bytes([wind_speed])                   # 1 byte
-    data += struct.pack("<H", wind_direction)     # 2 bytes
-    data += struct.pack("<H", barometer)          # 2 bytes
-    data += bytes([inside_humidity])              # 1 byte
-    data += bytes([outside_humidity])             # 1 byte
-    data += struct.pack("<H", rain_total)         # 2 bytes
-    data += struct.pack("<H", 0)                  # 2 bytes unused
-    assert len(data) == 15
-
-    # Calculate CRC over data bytes
-    crc = crc_calculate(data)
-    crc_bytes = struct.pack(">H", crc)  # big-endian CRC
+    # SOH + 15 data bytes + 2 CRC bytes, packed in place
+    packet = bytearray(1 + _BASIC_LAYOUT.size + _CRC.size)
+    packet[0] = SOH
+    _BASIC_LAYOUT.pack_into(
+        packet, 1,
+        inside_temp, outside_temp, wind_speed, wind_direction, barometer,
+        inside_humidity, outside_humidity, rain_total, 0,
+    )
 
-    return bytes([SOH]) + data + crc_bytes
+    # CRC over the data bytes, big-endian
+    crc = crc_calculate(memoryview(packet)[1:16])
+    _CRC.pack_into(packet, 16, crc)
+    return bytes(packet)
 
 
 class TestBasicLoopParsing:
@@ -100,7 +102,7 @@ class TestBasicLoopParsing:
     def test_corrupted_crc(self):
         raw = bytearray(_make_basic_packet())
         raw[-1] ^= 0xFF  # Corrupt last CRC byte
-        reading = parse_loop_packet(bytes(raw), StationModel.MONITOR)
+        reading = parse_loop_packet(memoryview(raw), StationModel.MONITOR)
         assert reading is None
 
     def test_solar_and_uv_none_for_basic(self):
@@ -0,0 +1,34 @@
+"""Tests for barometric pressure trend analysis."""
+
+from app.services.pressure_trend import (
+    TREND_THRESHOLD,
+    analyze_pressure_trend,
+    classify_trend,
+)
+
+
+class TestClassifyTrend:
+    def test_rising(self):
+        assert classify_trend(0, 30000, 3600, 30000 + TREND_THRESHOLD + 1) == "rising"
+
+    def test_falling(self):
+        assert classify_trend(0, 30000, 3600, 30000 - TREND_THRESHOLD - 1) == "falling"
+
+    def test_steady_at_threshold(self):
+        assert classify_trend(0, 30000, 3600, 30000 + TREND_THRESHOLD) == "steady"
+
+    def test_zero_elapsed_returns_none(self):
+        assert classify_trend(3600, 30000, 3600, 30100) is None
+
+
+class TestAnalyzePressureTrend:
+    def test_insufficient_data(self):
+        assert analyze_pressure_trend([(0, 30000)]) is None
+
+    def test_matches_classify_trend(self):
+        readings = [(0, 30000), (1800, 30010), (3 * 3600, 30060)]
+        result = analyze_pressure_trend(readings)
+        assert result is not None
+        assert result.trend == classify_trend(0, 30000, 3 * 3600, 30060)
+        assert result.change == 60
+        assert result.rate_per_hour == 20.0
@@ -0,0 +1,101 @@
+"""Tests for the spray constraint evaluation engine."""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("sqlalchemy")
+
+from app.services.spray_engine import (  # noqa: E402
+    ForecastWindow,
+    ProductConstraints,
+    evaluate_conditions,
+    evaluate_many,
+)
+
+
+def _hourly():
+    return {
+        "time": [f"2026-05-01T{h:02d}:00" for h in range(12)],
+        "temperature_2m": [40.0, 48.0, 55.0, 62.0, 70.0, 78.0, 84.0, 88.0, 86.0, 80.0, 72.0, 65.0],
+        "relative_humidity_2m": [90, 85, 80, 70, 60, 50, 45, 40, 42, 50, 60, 70],
+        "precipitation": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0],
+        "wind_speed_10m": [3.0, 4.0, 5.0, 6.0, 12.0, 8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0],
+        "wind_gusts_10m": [5.0, None, 9.0, None, None, 14.0, None, 9.0, 8.0, None, 4.0, 3.0],
+    }
+
+
+def _at(hour):
+    return datetime(2026, 5, 1, hour)
+
+
+class TestEvaluateMany:
+    def test_matches_evaluate_conditions(self):
+        hourly = _hourly()
+        herbicide = ProductConstraints(rain_free_hours=1.5, max_wind_mph=10.0)
+        pgr = ProductConstraints(
+            rain_free_hours=4.0, max_wind_mph=5.0, min_temp_f=50.0, max_temp_f=80.0,
+        )
+        humid = ProductConstraints(min_humidity_pct=40.0, max_humidity_pct=80.0)
+        requests = [
+            (herbicide, _at(0), _at(3)),
+            (pgr, _at(0), _at(3)),          # Shares the window above
+            (humid, _at(2), _at(5)),
+            (herbicide, _at(6), _at(9)),
+            (pgr, _at(9), _at(11)),
+            (humid, _at(0), _at(11)),
+        ]
+        assert evaluate_many(requests, hourly) == [
+            evaluate_conditions(c, hourly, start, end) for c, start, end in requests
+        ]
+
+    def test_no_forecast(self):
+        requests = [(ProductConstraints(), _at(0), _at(3))]
+        assert evaluate_many(requests, {"time": []}) == [
+            evaluate_conditions(ProductConstraints(), {"time": []}, _at(0), _at(3)),
+        ]
+
+
+def _wind_check(hourly, start, end):
+    ev = evaluate_conditions(ProductConstraints(max_wind_mph=10.0), hourly, _at(start), _at(end))
+    return next(c for c in ev.constraints if c.name == "wind")
+
+
+class TestPeakWind:
+    """Effective wind is the gust where reported, else that hour's sustained wind."""
+
+    def test_sustained_peak_above_gust_peak(self):
+        # Hour 4 has no gust and 12 mph sustained, above every reported gust
+        hourly = _hourly()
+        assert ForecastWindow(hourly, 2, 4).peak_wind() == (12.0, False)
+
+    def test_gust_peak_above_sustained(self):
+        hourly = _hourly()
+        assert ForecastWindow(hourly, 4, 6).peak_wind() == (14.0, True)
+
+    def test_gusts_shorter_than_window(self):
+        hourly = _hourly()
+        hourly["wind_gusts_10m"] = [5.0, 6.0]
+        assert ForecastWindow(hourly, 0, 4).peak_wind() == (12.0, False)
+
+    def test_no_wind_data(self):
+        hourly = _hourly()
+        hourly["wind_speed_10m"] = [None] * 12
+        hourly["wind_gusts_10m"] = [None] * 12
+        assert ForecastWindow(hourly, 0, 3).peak_wind() == (None, False)
+
+    def test_sustained_label(self):
+        check = _wind_check(_hourly(), 2, 4)
+        assert check.current_value == "12 mph (sustained)"
+        assert not check.passed
+
+    def test_gust_label(self):
+        check = _wind_check(_hourly(), 4, 6)
+        assert check.current_value == "14 mph (gust)"
+        assert not check.passed
+
+    def test_gust_within_limit(self):
+        check = _wind_check(_hourly(), 7, 9)
+        assert check.current_value == "9 mph (gust)"
+        assert check.passed
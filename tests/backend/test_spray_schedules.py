@@ -0,0 +1,85 @@
+"""Tests for spray schedule re-evaluation."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("sqlalchemy")
+
+from app.api.spray import _reevaluate_schedules  # noqa: E402
+
+CALM_OBS = {
+    "outside_temp_f": 65.0,
+    "outside_humidity_pct": 55,
+    "wind_speed_mph": 3,
+    "wind_gust_mph": 5,
+    "rain_rate_in_hr": 0.0,
+}
+
+
+def _schedule(schedule_id, planned_start="08:00", status="pending"):
+    return SimpleNamespace(
+        id=schedule_id,
+        planned_date="2026-05-01",
+        planned_start=planned_start,
+        planned_end="10:00",
+        status=status,
+        evaluation=None,
+        ai_commentary=None,
+    )
+
+
+def _product():
+    return SimpleNamespace(
+        rain_free_hours=2.0,
+        max_wind_mph=10.0,
+        min_temp_f=45.0,
+        max_temp_f=85.0,
+        min_humidity_pct=None,
+        max_humidity_pct=None,
+    )
+
+
+def _hourly():
+    return {
+        "time": [f"2026-05-01T{h:02d}:00" for h in range(24)],
+        "temperature_2m": [65.0] * 24,
+        "relative_humidity_2m": [55] * 24,
+        "precipitation": [0.0] * 24,
+        "wind_speed_10m": [3.0] * 24,
+        "wind_gusts_10m": [5.0] * 24,
+    }
+
+
+def _rain_free(schedule):
+    checks = json.loads(schedule.evaluation)["constraints"]
+    return next(c for c in checks if c["name"] == "rain_free")
+
+
+class TestReevaluateSchedules:
+    def test_unparseable_start_without_forecast(self):
+        schedule = _schedule(1, planned_start="not a time", status="no_go")
+        _reevaluate_schedules([(schedule, _product())], CALM_OBS, None, "")
+        assert schedule.evaluation is not None
+        assert schedule.status == "go"
+
+    def test_unparseable_start_with_forecast(self):
+        bad = _schedule(1, planned_start="not a time", status="no_go")
+        good = _schedule(2)
+        _reevaluate_schedules(
+            [(bad, _product()), (good, _product())], CALM_OBS, _hourly(), "",
+        )
+        # The bad window only loses the forecast rain-free check
+        assert bad.status == "go"
+        assert "forecast needed" in _rain_free(bad)["threshold"]
+        assert good.status == "go"
+        assert _rain_free(good)["threshold"] == "2.0h rain-free"
+
+    def test_ai_no_go_overrides(self):
+        schedule = _schedule(1)
+        schedule.ai_commentary = json.dumps({"go": False})
+        _reevaluate_schedules([(schedule, _product())], CALM_OBS, _hourly(), "")
+        assert schedule.status == "no_go"
@@ -0,0 +1,82 @@
+"""Tests for the WebSocket relay's fan-out queue and client channels."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("orjson")
+
+from app.ws.handler import CLIENT_QUEUE_SIZE, ConnectionManager, _ClientChannel  # noqa: E402
+
+
+def _drain(*items):
+    manager = ConnectionManager()
+    for item in items[1:]:
+        manager._queue.put_nowait(item)
+    return manager._drain_latest(items[0])
+
+
+class TestDrainLatest:
+    def test_keeps_only_newest_sensor_update(self):
+        result = _drain(
+            ("sensor_update", "s1"),
+            ("sensor_update", "s2"),
+            ("sensor_update", "s3"),
+        )
+        assert result == [("sensor_update", "s3")]
+
+    def test_keeps_every_alert_in_order(self):
+        result = _drain(
+            ("sensor_update", "s1"),
+            ("alert_triggered", '{"id":"wind"}'),
+            ("alert_triggered", '{"id":"temp"}'),
+            ("sensor_update", "s2"),
+            ("alert_cleared", '{"id":"wind"}'),
+        )
+        assert result == [
+            ("alert_triggered", '{"id":"wind"}'),
+            ("alert_triggered", '{"id":"temp"}'),
+            ("sensor_update", "s2"),
+            ("alert_cleared", '{"id":"wind"}'),
+        ]
+
+    def test_empties_the_queue(self):
+        manager = ConnectionManager()
+        manager._queue.put_nowait(("forecast_update", "f"))
+        manager._drain_latest(("sensor_update", "s"))
+        assert manager._queue.empty()
+
+
+def _pushed(pushes):
+    """Push (frame, droppable) pairs into a channel whose writer never runs."""
+    async def run():
+        channel = _ClientChannel(object(), lambda ws: None)
+        for frame, droppable in pushes:
+            channel.push(frame, droppable)
+        frames = list(channel._frames)
+        channel.close()
+        return frames
+    return asyncio.run(run())
+
+
+class TestClientChannel:
+    def test_drops_oldest_sensor_update_when_full(self):
+        pushes = [("alert", False)] + [(f"s{i}", True) for i in range(CLIENT_QUEUE_SIZE)]
+        frames = _pushed(pushes)
+        assert len(frames) == CLIENT_QUEUE_SIZE
+        assert frames[0] == (False, "alert")
+        assert frames[1] == (True, "s1")
+
+    def test_skips_sensor_update_when_full_of_control_frames(self):
+        pushes = [(f"c{i}", False) for i in range(CLIENT_QUEUE_SIZE)] + [("s", True)]
+        frames = _pushed(pushes)
+        assert len(frames) == CLIENT_QUEUE_SIZE
+        assert (True, "s") not in frames
+
+    def test_control_frames_are_capped(self):
+        pushes = [(f"c{i}", False) for i in range(CLIENT_QUEUE_SIZE + 10)]
+        frames = _pushed(pushes)
+        assert len(frames) == CLIENT_QUEUE_SIZE
+        assert frames[0] == (False, "c10")
+        assert frames[-1] == (False, f"c{CLIENT_QUEUE_SIZE + 9}")